@@ -1,7 +1,10 @@
 """Cross-domain content filtering: skip items linking to external websites."""
 
 import logging
-from urllib.parse import urlparse
+import re
+import sys
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -11,52 +14,191 @@ _TWO_LEVEL_SUFFIXES = (
     ".ac.cn", ".mil.cn",
 )
 
+# The same suffixes as (second_level, tld) label pairs: {("gov", "cn"), ...}
+_TWO_LEVEL_SET = frozenset(
+    tuple(suffix[1:].split(".")) for suffix in _TWO_LEVEL_SUFFIXES
+)
+
+# First character that terminates the authority part of a URL
+_HOST_END_RE = re.compile(r"[/?#]")
+
+# Leading "scheme://" (RFC 3986 scheme characters only)
+_SCHEME_PREFIX_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://")
+
 
+def _fast_hostname(url: str) -> str:
+    """Return the lowercased hostname of an absolute URL, or "" if none.
+
+    A lightweight stand-in for ``urlparse(url).hostname``: only the
+    authority component is sliced out, userinfo and port are dropped.
+    A "://" later in the URL (e.g. in a query string) is not a scheme.
+
+    Examples:
+        https://www.nea.gov.cn:8080/a                       -> www.nea.gov.cn
+        //www.nea.gov.cn/jump?url=http://www.other.com/a    -> www.nea.gov.cn
+        /jump?to=https://evil.com/                          -> ""
+    """
+    m = _SCHEME_PREFIX_RE.match(url)
+    if m:
+        start = m.end()
+    elif url.startswith("//"):
+        start = 2
+    else:
+        return ""
+
+    m = _HOST_END_RE.search(url, start)
+    netloc = url[start:m.start()] if m else url[start:]
+    netloc = netloc.rpartition("@")[2]
+
+    if netloc.startswith("["):
+        # IPv6 literal: [::1]:8080 -> ::1
+        end = netloc.find("]")
+        host = netloc[1:end] if end >= 0 else netloc[1:]
+    else:
+        host = netloc.partition(":")[0]
+    return host.lower()
+
+
+@lru_cache(maxsize=8192)
 def extract_root_domain(url: str) -> str:
     """Extract the root domain from a URL.
 
+    Results are memoized: the same source URL and many item URLs recur
+    across a batch, so repeated lookups skip URL parsing entirely. Roots
+    are interned so equal roots compare by identity.
+
     Examples:
         www.nea.gov.cn          -> nea.gov.cn
         zfxxgk.nea.gov.cn       -> nea.gov.cn
         www.xinhuanet.com       -> xinhuanet.com
         news.people.com.cn      -> people.com.cn
     """
-    try:
-        parsed = urlparse(url)
-        hostname = parsed.hostname or ""
-    except Exception:
+    if not url:
         return ""
+    return _root_from_hostname(_fast_hostname(url))
+
 
+def _root_from_hostname(hostname: str) -> str:
+    """Reduce a lowercased hostname to its root domain (see extract_root_domain)."""
     if not hostname:
         return ""
 
+    # IP addresses and dotless intranet hosts have no root domain
+    if _is_ip_or_bare_host(hostname):
+        return sys.intern(hostname)
+
     # Remove www. prefix
     if hostname.startswith("www."):
         hostname = hostname[4:]
 
-    # Check for two-level suffixes (e.g., .gov.cn, .com.cn)
-    for suffix in _TWO_LEVEL_SUFFIXES:
-        if hostname.endswith(suffix):
-            # hostname = "zfxxgk.nea.gov.cn", suffix = ".gov.cn"
-            # prefix = "zfxxgk.nea"
-            prefix = hostname[: -len(suffix)]
-            parts = prefix.rsplit(".", 1)
-            # Take last part before suffix: "nea" + ".gov.cn" -> "nea.gov.cn"
-            return parts[-1] + suffix
+    # Only the last three labels can matter: "zfxxgk.nea.gov.cn" -> [.., "nea", "gov", "cn"]
+    labels = hostname.rsplit(".", 3)
+    if len(labels) < 2:
+        return sys.intern(hostname)
+
+    # Two-level suffix (e.g., .gov.cn, .com.cn): keep one label before it
+    if (labels[-2], labels[-1]) in _TWO_LEVEL_SET:
+        return sys.intern(".".join(labels[-3:]))
 
     # Normal TLD: take last two segments
-    parts = hostname.rsplit(".", 2)
-    if len(parts) >= 2:
-        return ".".join(parts[-2:])
+    return sys.intern(".".join(labels[-2:]))
+
+
+def _is_ip_or_bare_host(hostname: str) -> bool:
+    """True for IPv4/IPv6 literals and single-label hosts like "localhost"."""
+    if "." not in hostname:
+        return True
+    digits = hostname.replace(".", "")
+    return digits.isascii() and digits.isdigit()
 
-    return hostname
+
+@lru_cache(maxsize=256)
+def _source_host_root(source_url: str) -> tuple[str, str]:
+    """Return (hostname, root domain) of a source URL for filtering.
+
+    The root is "" when filtering is disabled for the source: no hostname,
+    or a host that is an IP address or a single-label intranet name.
+    """
+    host = _fast_hostname(source_url) if source_url else ""
+    if not host or _is_ip_or_bare_host(host):
+        return host, ""
+    return host, _root_from_hostname(host)
 
 
 def is_same_domain(item_url: str, source_url: str) -> bool:
-    """Return True if item_url and source_url share the same root domain."""
-    if not item_url or not source_url:
+    """Return True if item_url and source_url share the same root domain.
+
+    Same rules as DomainFilter: items without a URL are kept, and sources
+    without a usable root domain (see _source_host_root) keep everything.
+    """
+    if not item_url:
         return True  # safe fallback: keep the item
-    return extract_root_domain(item_url) == extract_root_domain(source_url)
+    src_root = _source_host_root(source_url)[1]
+    if not src_root:
+        return True
+    return extract_root_domain(item_url) == src_root
+
+
+class DomainFilter:
+    """Cross-domain filter bound to a single source URL.
+
+    Source-side parsing happens once in __init__, and item hostnames seen
+    so far are mapped to their roots, so callers that check many items
+    against the same source (an agent run, a homepage batch) should keep
+    one instance around instead of calling the module-level helpers.
+    An empty or hostless source_url, or one whose host is an IP address or
+    a single-label intranet name, disables filtering (everything kept).
+    """
+
+    __slots__ = ("url_key", "_src_host", "_src_root", "_host_roots")
+
+    def __init__(self, source_url: str, url_key: str = "url"):
+        self.url_key = url_key
+        self._src_host, self._src_root = _source_host_root(source_url)
+        self._host_roots: dict[str, str] = {}
+        if self._src_host and not self._src_root:
+            logger.debug("Domain filter disabled: IP/intranet source %s", self._src_host)
+
+    def is_same_domain(self, url: str) -> bool:
+        """Return True if url shares the source's root domain (or is empty)."""
+        if not url or not self._src_root:
+            return True
+        # Links on the source's own host need no root lookup at all
+        host = _fast_hostname(url)
+        if host == self._src_host:
+            return True
+        root = self._host_roots.get(host)
+        if root is None:
+            root = self._host_roots[host] = _root_from_hostname(host)
+        return root == self._src_root
+
+    def iter_filter(self, items: Iterable[dict]) -> Iterator[dict]:
+        """Yield items on the source's root domain; logs the skipped count at the end."""
+        if not self._src_root:
+            yield from items
+            return
+
+        url_key = self.url_key
+        kept = skipped = 0
+        try:
+            for item in items:
+                if self.is_same_domain(item.get(url_key, "")):
+                    kept += 1
+                    yield item
+                else:
+                    skipped += 1
+        finally:
+            if skipped:
+                logger.info(
+                    "Domain filter: kept %d, skipped %d cross-domain items (source=%s)",
+                    kept, skipped, self._src_root,
+                )
+
+    def filter(self, items: list[dict]) -> list[dict]:
+        """Return items on the source's root domain (items unchanged if disabled)."""
+        if not self._src_root:
+            return items
+        return list(self.iter_filter(items))
 
 
 def filter_by_domain(
@@ -67,23 +209,6 @@ def filter_by_domain(
     """Return only items whose URL shares the same root domain as source_url.
 
     Items without a URL are kept (safe fallback).
-    If source_url is empty, all items are returned unchanged.
+    If source_url is empty or has no hostname, all items are returned unchanged.
     """
-    if not source_url:
-        return items
-
-    result = []
-    skipped = 0
-    for item in items:
-        url = item.get(url_key, "")
-        if not url or is_same_domain(url, source_url):
-            result.append(item)
-        else:
-            skipped += 1
-
-    if skipped:
-        logger.info(
-            "Domain filter: kept %d, skipped %d cross-domain items (source=%s)",
-            len(result), skipped, extract_root_domain(source_url),
-        )
-    return result
+    return DomainFilter(source_url, url_key).filter(items)
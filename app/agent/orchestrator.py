@@ -1,26 +1,37 @@
 """Orchestrator: manages parallel agent execution for multiple sources."""
 import asyncio
+import hashlib
+import heapq
+import html
 import json
 import logging
 import re
+import time
 import uuid
 from collections import defaultdict
+from itertools import groupby
 from datetime import datetime, date, timedelta
 
-from sqlalchemy import select, delete
+from sqlalchemy import Row, select, delete, insert, update, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.database.connection import async_session
 from app.models.source import MonitorSource
 from app.models.task import CrawlTask, TaskStatus, TriggerType
 from app.models.result import CrawlResult
 from app.models.report import Report
+from app.models.section_cache import SectionCache
+from app.models.summary_cache import SummaryCache
 from app.agent.runtime import run_agent, AgentResult
 from app.agent.prompts import build_section_prompt, DEFAULT_CRAWL_RULES
-from app.agent.tools.browser import browse_page, close_browser
+from app.agent.tools.browser import browse_page, close_browser, ensure_browser
 from app.llm.client import simple_completion
 from app.llm.schemas import CRAWLER_TOOLS
 from app.notification.engine import dispatch_report
-from app.config import AGENT_MAX_CONCURRENCY, LLM_MAX_CONCURRENCY
+from app.config import (
+    AGENT_MAX_CONCURRENCY, LLM_MAX_CONCURRENCY, BROWSE_MAX_CONCURRENCY, SECTION_MAX_CONCURRENCY,
+    HOMEPAGE_FILTER_MIN_TOKENS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,29 +41,97 @@ _running_sources: set[int] = set()
 # task_id -> asyncio.Event, set() means cancellation requested
 _cancel_flags: dict[int, asyncio.Event] = {}
 
+
+class _CancelRequested(Exception):
+    """Raised inside a TaskGroup to cancel its sibling tasks on user abort."""
+
+
 # Section history: track consecutive empty runs per section
 # source_id -> {section_url -> consecutive_empty_count}
-_section_history: dict[int, dict[str, int]] = {}
+_section_history: defaultdict[int, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
 _SECTION_SKIP_THRESHOLD = 3  # skip section after N consecutive empty runs
 
 # Max sections to identify and crawl
 MAX_SECTIONS = 5
 
+# Markdown code fence wrapped around LLM JSON output: leading ```json / trailing ```
+_CODE_FENCE_RE = re.compile(r"^```\w*\n?|\n?```$")
+
+# Display labels for item content_type in prompts and reports
+_CONTENT_TYPE_LABELS = {"news": "新闻", "policy": "政策", "notice": "通知", "file": "文件"}
+
 # Regex for leading date pattern like "2026-02-06 "
 _LEADING_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}\s*')
 
 
+def _canon_url(url: str) -> str:
+    """Treat http:// and https:// as the same URL for dedup (https form)."""
+    return "https://" + url[7:] if url.startswith("http://") else url
+
+
+def _strip_code_fence(raw: str) -> str:
+    """Strip whitespace and a surrounding ``` code fence from an LLM response."""
+    raw = raw.strip()
+    if raw.startswith("```"):
+        raw = _CODE_FENCE_RE.sub("", raw).strip()
+    return raw
+
+
+def _slice_json_span(text: str, opener: str = "[", closer: str = "]", start: int = 0) -> str | None:
+    """Return text from the first opener to the last closer (inclusive), or None.
+
+    Same span as a greedy DOTALL opener-.*-closer regex search, but found
+    with two plain str scans instead of a backtracking regex.
+    """
+    lo = text.find(opener, start)
+    hi = text.rfind(closer)
+    return text[lo:hi + 1] if 0 <= lo < hi else None
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _load_json_span(text: str, opener: str = "[", closer: str = "]", start: int = 0):
+    """Parse the JSON value that begins at the first opener at or after start.
+
+    raw_decode stops at the end of that value, so trailing prose is ignored
+    even if it contains closers. Falls back to the first-opener..last-closer
+    span, and parses text[start:] whole if there is no opener.
+    Raises json.JSONDecodeError when nothing parses.
+    """
+    lo = text.find(opener, start)
+    if lo < 0:
+        return json.loads(text[start:])
+    try:
+        return _JSON_DECODER.raw_decode(text, lo)[0]
+    except json.JSONDecodeError:
+        return json.loads(_slice_json_span(text, opener, closer, lo) or text[start:])
+
+
+def _parse_iso_date(value: str | None) -> date | None:
+    """Parse a YYYY-MM-DD string, returning None if missing or malformed."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def _clean_title(title: str) -> str:
     """Clean a title by removing embedded dates and extra whitespace/newlines."""
     if not title:
         return title
     # Replace newlines with spaces
     title = title.replace('\n', ' ').replace('\r', ' ')
-    # Strip leading date patterns like "2026-02-06 "
-    title = _LEADING_DATE_RE.sub('', title)
+    # Strip leading date patterns like "2026-02-06 " (only titles starting
+    # with a digit can match, so skip the regex for the rest)
+    if title[0].isdigit():
+        m = _LEADING_DATE_RE.match(title)
+        if m:
+            title = title[m.end():]
     # Strip whitespace
-    title = title.strip()
-    return title
+    return title.strip()
 
 
 def request_cancel(task_id: int):
@@ -96,8 +175,8 @@ async def run_batch(
     runnable: list[MonitorSource] = []
 
     try:
-        # Fetch sources
-        async with async_session() as session:
+        # Fetch sources and create their task records in one session/transaction
+        async with async_session() as session, session.begin():
             query = select(MonitorSource).where(
                 MonitorSource.is_active == True,
                 MonitorSource.user_id == user_id,
@@ -107,50 +186,51 @@ async def run_batch(
             result = await session.execute(query)
             sources = list(result.scalars().all())
 
-        if not sources:
-            logger.warning("No active sources found for batch %s", batch_id)
-            return batch_id
+            if not sources:
+                logger.warning("No active sources found for batch %s", batch_id)
+                return batch_id
 
-        # Filter out sources that are already running
-        already_running = []
-        for src in sources:
-            if src.id in _running_sources:
-                already_running.append(src.name)
-            else:
-                runnable.append(src)
+            # Filter out sources that are already running
+            already_running = []
+            for src in sources:
+                if src.id in _running_sources:
+                    already_running.append(src.name)
+                else:
+                    runnable.append(src)
 
-        if already_running:
-            logger.info("Skipping already-running sources: %s", already_running)
+            if already_running:
+                logger.info("Skipping already-running sources: %s", already_running)
 
-        if not runnable:
-            logger.warning("All requested sources are already running")
-            return batch_id
+            if not runnable:
+                logger.warning("All requested sources are already running")
+                return batch_id
 
-        # Mark sources as running
-        for src in runnable:
-            _running_sources.add(src.id)
-
-        # Create task records
-        tasks_map: dict[int, int] = {}  # source_id -> task_id
-        async with async_session() as session:
+            # Mark sources as running
             for src in runnable:
-                task = CrawlTask(
-                    batch_id=batch_id,
-                    source_id=src.id,
-                    source_name=src.name,
-                    status=TaskStatus.pending.value,
-                    triggered_by=triggered_by,
-                    user_id=user_id,
-                )
-                session.add(task)
-            await session.commit()
-
-            # Re-fetch to get IDs
-            q = await session.execute(
-                select(CrawlTask).where(CrawlTask.batch_id == batch_id)
+                _running_sources.add(src.id)
+
+            # Create task records (single INSERT ... RETURNING for the new IDs)
+            inserted = await session.execute(
+                insert(CrawlTask).returning(CrawlTask.id, CrawlTask.source_id),
+                [
+                    {
+                        "batch_id": batch_id,
+                        "source_id": src.id,
+                        "source_name": src.name,
+                        "status": TaskStatus.pending.value,
+                        "triggered_by": triggered_by,
+                        "user_id": user_id,
+                    }
+                    for src in runnable
+                ],
             )
-            for t in q.scalars():
-                tasks_map[t.source_id] = t.id
+            tasks_map: dict[int, int] = {sid: tid for tid, sid in inserted.all()}  # source_id -> task_id
+
+        # Start the shared browser once up front instead of in the first source's fetch
+        try:
+            await ensure_browser()
+        except Exception as e:
+            logger.warning("Browser warm-up failed, will retry on first page load: %s", e)
 
         # Run agents in parallel with concurrency limit
         sem = asyncio.Semaphore(AGENT_MAX_CONCURRENCY)
@@ -159,11 +239,16 @@ async def run_batch(
             async with sem:
                 try:
                     await _run_single_source(src, tid, bid, user_id=user_id)
+                except Exception as e:
+                    # Contain per-source failures so they don't cancel the rest of the batch
+                    logger.error("[%s] Source run failed: %s", src.name, e)
                 finally:
                     _running_sources.discard(src.id)
 
-        agent_tasks = [_limited_run(src, tasks_map[src.id], batch_id) for src in runnable]
-        await asyncio.gather(*agent_tasks, return_exceptions=True)
+        # TaskGroup: if the batch itself is cancelled, every source task is cancelled with it
+        async with asyncio.TaskGroup() as tg:
+            for src in runnable:
+                tg.create_task(_limited_run(src, tasks_map[src.id], batch_id))
 
         # Generate and dispatch report
         await _generate_report(batch_id, user_id=user_id)
@@ -182,58 +267,83 @@ async def run_batch(
     return batch_id
 
 
-async def _get_existing_urls(source_id: int) -> list[str]:
+async def _get_existing_urls(source_id: int) -> set[str]:
     """Fetch all previously crawled URLs for a source (for deduplication)."""
+    # Stream through a server-side cursor straight into the set, so the full
+    # result is never materialized as a list of Row tuples first
     async with async_session() as session:
-        result = await session.execute(
-            select(CrawlResult.url).where(CrawlResult.source_id == source_id)
+        urls = await session.stream_scalars(
+            select(CrawlResult.url).where(CrawlResult.source_id == source_id).distinct()
         )
-        return [row[0] for row in result.all()]
+        return {url async for url in urls}
 
 
 ##############################################################################
 # Phase 1a: Homepage — extract items (pure code) + identify sections (LLM)
 ##############################################################################
 
+def _date_sort_key(item: dict) -> str:
+    """Sort key for newest-first ordering; undated items sort last."""
+    return item.get("published_date") or "0000-00-00"
+
+
 def _normalize_date(d: str) -> str:
     """Normalize a date string to YYYY-MM-DD with zero-padding.
 
     Handles formats like '2026-2-3' -> '2026-02-03'.
     """
+    # Common case: already YYYY-MM-DD, nothing to pad
+    if len(d) == 10 and d[4] == '-' and d[7] == '-':
+        return d
     parts = d.split('-')
     if len(parts) == 3:
-        try:
-            return f"{parts[0]}-{parts[1].zfill(2)}-{parts[2].zfill(2)}"
-        except Exception:
-            pass
+        return f"{parts[0]}-{parts[1].zfill(2)}-{parts[2].zfill(2)}"
     return d
 
 
+# Section markers written by browse_page: the link list, then the
+# "extractable items" JSON array
+_LINKS_MARKER = "--- 页面链接列表 ---"
+_ITEMS_MARKER = "--- 可直接采集的条目"
+
+# Items section size above which item extraction (JSON parse + filtering)
+# runs in a worker thread, so other sources' I/O isn't stalled meanwhile
+_OFFLOAD_MIN_CHARS = 32768
+
+
+def _split_homepage(page_text: str) -> tuple[str, str]:
+    """Split browse_page output into (link list section, items section).
+
+    Each marker is located once; a missing section comes back as "".
+    The link list runs up to the items marker (or the end of the text).
+    """
+    links_pos = page_text.find(_LINKS_MARKER)
+    items_pos = page_text.find(_ITEMS_MARKER, max(links_pos, 0))
+    items_blob = page_text[items_pos:] if items_pos >= 0 else ""
+    if links_pos < 0:
+        return "", items_blob
+    return page_text[links_pos:items_pos if items_pos >= 0 else None], items_blob
+
+
 def _extract_homepage_items(
-    page_text: str,
+    items_blob: str,
     date_start: str,
     date_end: str,
     source_url: str = "",
 ) -> list[dict]:
     """Extract directly-harvestable items from browse_page output (no LLM).
 
-    Looks for the "--- 可直接采集的条目" marker, parses the JSON array,
-    filters by date range, and deduplicates by URL.
+    items_blob is the "--- 可直接采集的条目" section from _split_homepage;
+    parses its JSON array, filters by date range, and deduplicates by URL.
 
     Returns: [{"title", "url", "published_date", ...}, ...]
     """
-    items_marker = "--- 可直接采集的条目"
-    if items_marker not in page_text:
-        return []
-
-    items_text = page_text[page_text.index(items_marker):]
-    # Find JSON array in the text
-    match = re.search(r"\[.*\]", items_text, re.DOTALL)
-    if not match:
+    if not items_blob:
         return []
 
+    # Parse the JSON array that follows the marker
     try:
-        raw_items = json.loads(match.group(0))
+        raw_items = _load_json_span(items_blob)
     except json.JSONDecodeError:
         return []
 
@@ -250,7 +360,7 @@ def _extract_homepage_items(
         if not url or not item.get("title"):
             continue
         # Normalize http/https
-        norm_url = url.replace("http://", "https://")
+        norm_url = _canon_url(url)
         if norm_url in seen_urls:
             continue
         seen_urls.add(norm_url)
@@ -290,10 +400,55 @@ def _is_local_dynamics(title: str) -> bool:
     return bool(_LOCAL_DYNAMICS_RE.search(title))
 
 
+def _regex_only_filter(items: list[dict], local_flags: list[bool]) -> list[dict]:
+    """Drop regex-flagged local dynamics, keeping everything if all are flagged."""
+    non_local = [item for item, is_local in zip(items, local_flags) if not is_local]
+    if non_local:
+        logger.info("Homepage filter (regex only): %d -> %d items", len(items), len(non_local))
+        return non_local
+    return items
+
+
+# Phase 1a homepage quality filter prompt; user template takes count,
+# crawl_rules and items_text
+_FILTER_SYSTEM = (
+    "你是政策信息筛选专家，服务于咨询公司行业顾问。"
+    "你的核心任务是过滤掉地方监管局的日常工作动态，只保留全国性、国家级的高价值内容。"
+)
+_FILTER_USER_TEMPLATE = (
+    "请从以下 {count} 条条目中，筛选出值得保留的高价值内容。\n\n"
+    "## 过滤规则（必须严格执行）\n\n"
+    "### 必须过滤的内容（地方监管动态）\n"
+    "标题以地方机构名开头的条目属于地方监管动态，应当过滤：\n"
+    "- 地方机构前缀：华北、华东、华中、南方、东北、西北 + 能源监管局/监管办\n"
+    "- 省级机构：XX省发改委、XX省能源局、XX市XX局\n"
+    "- 标记为 [疑似地方] 的条目大概率应过滤\n\n"
+    "过滤示例：\n"
+    '- "华北能源监管局强化河北南网电力保供监管" → 过滤\n'
+    '- "华东能源监管局赴江苏能源监管办开展调研" → 过滤\n'
+    '- "南方能源监管局召开安全生产例会" → 过滤\n'
+    '- "山东能源监管办开展春节保供电检查" → 过滤\n'
+    '- "东北能源监管局组织召开辽宁电力市场座谈会" → 过滤\n\n'
+    "### 必须保留的内容（全国性高价值）\n"
+    "- 国家级机构发布：国家能源局、国务院、部委等\n"
+    "- 高级领导人活动：习近平、国务院总理、部长级\n"
+    "- 全国性数据/会议/政策\n\n"
+    "保留示例：\n"
+    '- "国家能源局新闻发布会文字实录" → 保留\n'
+    '- "国家能源局发布全国电力统计数据" → 保留\n'
+    '- "习近平同越共中央总书记通电话" → 保留\n'
+    '- "2025年度能源行业十大科技创新成果" → 保留\n\n'
+    "## 采集规则\n{crawl_rules}\n\n"
+    "## 条目列表\n{items_text}\n\n"
+    "请返回保留的编号JSON数组，如 [0, 3, 5]。直接输出JSON，不加其他内容。"
+)
+
+
 async def _filter_homepage_items(
     items: list[dict],
     crawl_rules: str,
     on_progress=None,
+    max_items: int | None = None,
 ) -> list[dict]:
     """Use regex pre-filter + LLM to filter homepage items, removing low-value content.
 
@@ -302,16 +457,17 @@ async def _filter_homepage_items(
     2. LLM filtering with few-shot examples for accurate classification
 
     Returns a subset of items that pass the quality filter.
-    Falls back to regex-only filtering on LLM failure.
+    Falls back to regex-only filtering on LLM failure, and uses it directly
+    when the items fit within max_items and the item list is too small to be
+    worth an LLM call (see HOMEPAGE_FILTER_MIN_TOKENS).
     """
     if len(items) <= 3:
         return items
 
-    # Stage 1: Regex pre-annotation
-    local_flags = []
-    for item in items:
-        title = item.get("title", "")
-        local_flags.append(_is_local_dynamics(title))
+    # Stage 1: Regex pre-annotation. Titles are pulled out once as a parallel
+    # column; the token estimate and prompt below reuse it.
+    titles = [item.get("title", "") for item in items]
+    local_flags = list(map(_is_local_dynamics, titles))
 
     local_count = sum(local_flags)
     logger.info("Homepage filter: %d/%d items flagged as local dynamics by regex",
@@ -321,59 +477,29 @@ async def _filter_homepage_items(
     if local_count == 0:
         return items
 
-    # Stage 2: LLM filtering with enhanced prompt and few-shot examples
-    lines = []
-    for i, item in enumerate(items):
-        title = item.get("title", "")
-        url = item.get("url", "")[:80]
-        date = item.get("published_date", "")
-        tag = " [疑似地方]" if local_flags[i] else ""
-        lines.append(f"[{i}] {date} | {title}{tag} | {url}")
-
-    items_text = "\n".join(lines)
+    # Small list that already fits the quota: the regex flags are enough
+    if HOMEPAGE_FILTER_MIN_TOKENS and max_items is not None and len(items) <= max_items:
+        approx_tokens = (
+            sum(map(len, titles)) + sum(len(item.get("url", "")) for item in items) + 20 * len(items)
+        ) // 4
+        if approx_tokens < HOMEPAGE_FILTER_MIN_TOKENS:
+            logger.info("Homepage filter: ~%d tokens, skipping LLM", approx_tokens)
+            return _regex_only_filter(items, local_flags)
 
-    system = (
-        "你是政策信息筛选专家，服务于咨询公司行业顾问。"
-        "你的核心任务是过滤掉地方监管局的日常工作动态，只保留全国性、国家级的高价值内容。"
-    )
-    user = (
-        f"请从以下 {len(items)} 条条目中，筛选出值得保留的高价值内容。\n\n"
-        f"## 过滤规则（必须严格执行）\n\n"
-        f"### 必须过滤的内容（地方监管动态）\n"
-        f"标题以地方机构名开头的条目属于地方监管动态，应当过滤：\n"
-        f"- 地方机构前缀：华北、华东、华中、南方、东北、西北 + 能源监管局/监管办\n"
-        f"- 省级机构：XX省发改委、XX省能源局、XX市XX局\n"
-        f"- 标记为 [疑似地方] 的条目大概率应过滤\n\n"
-        f"过滤示例：\n"
-        f'- "华北能源监管局强化河北南网电力保供监管" → 过滤\n'
-        f'- "华东能源监管局赴江苏能源监管办开展调研" → 过滤\n'
-        f'- "南方能源监管局召开安全生产例会" → 过滤\n'
-        f'- "山东能源监管办开展春节保供电检查" → 过滤\n'
-        f'- "东北能源监管局组织召开辽宁电力市场座谈会" → 过滤\n\n'
-        f"### 必须保留的内容（全国性高价值）\n"
-        f"- 国家级机构发布：国家能源局、国务院、部委等\n"
-        f"- 高级领导人活动：习近平、国务院总理、部长级\n"
-        f"- 全国性数据/会议/政策\n\n"
-        f"保留示例：\n"
-        f'- "国家能源局新闻发布会文字实录" → 保留\n'
-        f'- "国家能源局发布全国电力统计数据" → 保留\n'
-        f'- "习近平同越共中央总书记通电话" → 保留\n'
-        f'- "2025年度能源行业十大科技创新成果" → 保留\n\n'
-        f"## 采集规则\n{crawl_rules}\n\n"
-        f"## 条目列表\n{items_text}\n\n"
-        f"请返回保留的编号JSON数组，如 [0, 3, 5]。直接输出JSON，不加其他内容。"
+    # Stage 2: LLM filtering with enhanced prompt and few-shot examples
+    items_text = "\n".join(
+        f"[{i}] {item.get('published_date', '')} | {title}"
+        f"{' [疑似地方]' if flagged else ''} | {item.get('url', '')[:80]}"
+        for i, (item, title, flagged) in enumerate(zip(items, titles, local_flags))
     )
 
+    user = _FILTER_USER_TEMPLATE.format(count=len(items), crawl_rules=crawl_rules, items_text=items_text)
+
     try:
-        raw = await simple_completion(user, system=system, temperature=0.1, max_tokens=512)
-        raw = raw.strip()
-        if raw.startswith("```"):
-            raw = re.sub(r"^```\w*\n?", "", raw)
-            raw = re.sub(r"\n?```$", "", raw)
-            raw = raw.strip()
-        match = re.search(r"\[.*\]", raw, re.DOTALL)
-        if match:
-            indices = json.loads(match.group(0))
+        raw = await simple_completion(user, system=_FILTER_SYSTEM, temperature=0.1, max_tokens=512)
+        raw = _strip_code_fence(raw)
+        if "[" in raw:
+            indices = _load_json_span(raw)
             if isinstance(indices, list):
                 valid = [i for i in indices if isinstance(i, int) and 0 <= i < len(items)]
                 if valid:
@@ -393,12 +519,7 @@ async def _filter_homepage_items(
         logger.warning("Homepage item filtering LLM failed, applying regex-only filter: %s", e)
 
     # Fallback: use regex-only filtering when LLM fails or returns invalid result
-    non_local = [item for item, is_local in zip(items, local_flags) if not is_local]
-    if non_local:
-        logger.info("Homepage filter (regex fallback): %d -> %d items", len(items), len(non_local))
-        return non_local
-
-    return items
+    return _regex_only_filter(items, local_flags)
 
 
 def _merge_similar_sections(sections: list[dict]) -> list[dict]:
@@ -447,61 +568,93 @@ def _merge_similar_sections(sections: list[dict]) -> list[dict]:
     return merged
 
 
+# Dates in a homepage link line (link tag or URL path); dated lines are
+# articles, which rotate daily and must not affect the nav fingerprint
+_NAV_DATE_RE = re.compile(r"\d{4}[-/.年]\d{1,2}[-/.月]\d{1,2}")
+
+
+def _nav_fingerprint(link_section: str, source: MonitorSource, crawl_rules: str) -> str:
+    """Hash the undated (navigation) links plus the other prompt inputs."""
+    h = hashlib.sha256()
+    h.update(f"{source.name}\n{source.url}\n{crawl_rules}\n".encode())
+    for line in link_section.splitlines():
+        if not _NAV_DATE_RE.search(line):
+            h.update(line.encode())
+            h.update(b"\n")
+    return h.hexdigest()
+
+
+# Phase 1a section identification prompt; user template takes name, url,
+# crawl_rules, max_sections and link_section
+_SECTIONS_SYSTEM = "你是网页结构分析专家。请从链接列表中识别出值得深入采集的栏目列表页URL。"
+_SECTIONS_USER_TEMPLATE = (
+    "以下是 {name}（{url}）首页的链接列表。\n"
+    "请从中找出值得深入采集的栏目列表页链接。\n\n"
+    "## 栏目筛选规则（请严格遵守）\n{crawl_rules}\n\n"
+    "## 数量限制（非常重要）\n"
+    "- 最多返回 {max_sections} 个栏目，优先选择高价值栏目\n"
+    "- 内容高度相似的栏目必须合并：如果一个大栏目下有多个子栏目（如\"政策\"下有\"最新文件\"\"通知\"\"公告\"等），只返回大栏目的入口URL，不要分别列出每个子栏目\n"
+    "- 排除地方性栏目（名称含\"派出\"\"地方\"\"区域\"的栏目）\n"
+    "- 排除互动服务类栏目（名称含\"留言\"\"举报\"\"互动\"\"信访\"\"咨询\"）\n"
+    "- 排除静态信息栏目（名称含\"简介\"\"指南\"\"机构设置\"\"领导信息\"）\n\n"
+    "要求：\n"
+    "- 返回JSON数组：[{{\"name\": \"栏目名\", \"url\": \"列表页完整URL\"}}]\n"
+    "- 只返回能进入文章列表的栏目页链接（如 /zcfg/、/tzgg/、/gzdt/ 等栏目入口），不要具体文章详情链接\n"
+    "- 栏目入口URL通常较短、不含日期，文章URL通常较长、含日期路径\n"
+    "- 直接输出JSON，不加其他内容\n\n"
+    "链接列表：\n{link_section}"
+)
+
+
+async def _store_sections(source: MonitorSource, link_hash: str, sections: list[dict]):
+    """Upsert the identified sections for a source; failures only cost a cache miss."""
+    try:
+        async with async_session() as session, session.begin():
+            await session.merge(SectionCache(
+                source_id=source.id, link_hash=link_hash, sections=sections,
+            ))
+    except Exception as e:
+        logger.warning("[%s] Failed to cache homepage sections: %s", source.name, e)
+
+
 async def _identify_sections(
-    page_text: str,
+    link_section: str,
     source: MonitorSource,
     on_progress=None,
 ) -> list[dict]:
-    """Use LLM to identify section list-page URLs from the homepage.
+    """Use LLM to identify section list-page URLs from the homepage link list.
 
-    Injects source.crawl_rules into the prompt.
+    Injects source.crawl_rules into the prompt. The result is cached per source
+    and reused while the homepage navigation links stay unchanged.
     Returns: [{"name": "栏目名", "url": "列表页URL"}, ...]
     Falls back to [{"name": source.name, "url": source.url}] on failure.
     """
     fallback = [{"name": source.name, "url": source.url}]
     crawl_rules = source.crawl_rules or DEFAULT_CRAWL_RULES
 
-    # Extract just the link list section
-    link_section = ""
-    link_marker = "--- 页面链接列表 ---"
-    if link_marker in page_text:
-        link_section = page_text[page_text.index(link_marker):]
-        items_marker = "--- 可直接采集的条目"
-        if items_marker in link_section:
-            link_section = link_section[:link_section.index(items_marker)]
-    if not link_section:
-        link_section = page_text[:8000]
-
-    system = "你是网页结构分析专家。请从链接列表中识别出值得深入采集的栏目列表页URL。"
-    user = (
-        f"以下是 {source.name}（{source.url}）首页的链接列表。\n"
-        f"请从中找出值得深入采集的栏目列表页链接。\n\n"
-        f"## 栏目筛选规则（请严格遵守）\n{crawl_rules}\n\n"
-        f"## 数量限制（非常重要）\n"
-        f"- 最多返回 {MAX_SECTIONS} 个栏目，优先选择高价值栏目\n"
-        f"- 内容高度相似的栏目必须合并：如果一个大栏目下有多个子栏目（如\"政策\"下有\"最新文件\"\"通知\"\"公告\"等），只返回大栏目的入口URL，不要分别列出每个子栏目\n"
-        f"- 排除地方性栏目（名称含\"派出\"\"地方\"\"区域\"的栏目）\n"
-        f"- 排除互动服务类栏目（名称含\"留言\"\"举报\"\"互动\"\"信访\"\"咨询\"）\n"
-        f"- 排除静态信息栏目（名称含\"简介\"\"指南\"\"机构设置\"\"领导信息\"）\n\n"
-        f"要求：\n"
-        f"- 返回JSON数组：[{{\"name\": \"栏目名\", \"url\": \"列表页完整URL\"}}]\n"
-        f"- 只返回能进入文章列表的栏目页链接（如 /zcfg/、/tzgg/、/gzdt/ 等栏目入口），不要具体文章详情链接\n"
-        f"- 栏目入口URL通常较短、不含日期，文章URL通常较长、含日期路径\n"
-        f"- 直接输出JSON，不加其他内容\n\n"
-        f"链接列表：\n{link_section}"
+    link_hash = _nav_fingerprint(link_section, source, crawl_rules)
+    try:
+        async with async_session() as session:
+            cached = await session.get(SectionCache, source.id)
+    except Exception as e:
+        logger.warning("[%s] Section cache lookup failed: %s", source.name, e)
+        cached = None  # treat as a cache miss
+    if cached and cached.link_hash == link_hash and cached.sections:
+        if on_progress:
+            await on_progress(f"Phase 1a: 首页导航未变化，复用 {len(cached.sections)} 个栏目")
+        logger.info("[%s] Homepage navigation unchanged, reusing %d cached sections",
+                    source.name, len(cached.sections))
+        return cached.sections
+
+    user = _SECTIONS_USER_TEMPLATE.format(
+        name=source.name, url=source.url, crawl_rules=crawl_rules,
+        max_sections=MAX_SECTIONS, link_section=link_section,
     )
 
     try:
-        raw = await simple_completion(user, system=system, temperature=0.1, max_tokens=2048)
-        raw = raw.strip()
-        if raw.startswith("```"):
-            raw = re.sub(r"^```\w*\n?", "", raw)
-            raw = re.sub(r"\n?```$", "", raw)
-            raw = raw.strip()
-        match = re.search(r"\[.*\]", raw, re.DOTALL)
-        if match:
-            raw = match.group(0)
-        sections = json.loads(raw)
+        raw = await simple_completion(user, system=_SECTIONS_SYSTEM, temperature=0.1, max_tokens=2048)
+        raw = _strip_code_fence(raw)
+        sections = _load_json_span(raw)
         if isinstance(sections, list) and sections:
             valid = [s for s in sections if isinstance(s, dict) and s.get("url")]
             if valid:
@@ -515,6 +668,7 @@ async def _identify_sections(
                     await on_progress(msg)
                 logger.info("[%s] Homepage navigation: %d raw -> %d after merge (max %d)",
                             source.name, raw_count, len(valid), MAX_SECTIONS)
+                await _store_sections(source, link_hash, valid)
                 return valid
     except (json.JSONDecodeError, Exception) as e:
         logger.warning("[%s] Homepage navigation LLM parse failed: %s", source.name, e)
@@ -531,100 +685,174 @@ async def _identify_sections(
 async def _crawl_all_sections(
     source: MonitorSource,
     sections: list[dict],
-    existing_urls: list[str],
+    existing_urls: set[str],
     cancel_event: asyncio.Event | None,
     on_progress=None,
     crawl_rules: str = "",
+    max_items: int | None = None,
+    seed_urls: list[str] | None = None,
 ) -> list[dict]:
-    """Run a crawler sub-agent for each section (serial), return merged items.
+    """Run crawler sub-agents for the sections concurrently, return merged items.
 
     Each sub-agent gets a clean context window with enable_pruning=True.
-    Later sections receive URLs from earlier sections for cross-section dedup.
+    Up to SECTION_MAX_CONCURRENCY sections run at once; a section that starts
+    after others have finished receives their URLs for cross-section dedup,
+    and results are deduped again as each section is merged.
+    max_items is the quota left for sections (defaults to source.max_items).
+    A starting section reserves its share of the unreserved quota, split
+    evenly with the sections that can run alongside it, and its sub-agent is
+    told that share; the unused part is released when it finishes. Sections
+    not yet started are skipped once the quota is met or fully reserved.
+    existing_urls (historical) are only used for membership checks; prompts
+    list URLs found in this run, starting with seed_urls (homepage items).
     """
     time_range_days = source.time_range_days or 7
-    max_items = source.max_items or 30
+    if max_items is None:
+        max_items = source.max_items or 30
     today = datetime.now()
     start_date = today - timedelta(days=time_range_days)
     date_range = f"{start_date.strftime('%Y-%m-%d')} 至 {today.strftime('%Y-%m-%d')}"
 
     all_items: list[dict] = []
+    collected = 0
+    # Quota promised to running sections, and counters used to split it
+    reserved = 0
+    in_flight = 0
+    not_started = sum(1 for section in sections if section.get("url"))
+    section_slots = min(SECTION_MAX_CONCURRENCY, AGENT_MAX_CONCURRENCY)
+    # Set for membership (history + this run), list of this run's URLs in
+    # collection order for handing to prompts
+    collected_url_list = list(dict.fromkeys(seed_urls or ()))
     collected_urls = set(existing_urls)
+    collected_urls.update(collected_url_list)
+    section_sem = asyncio.Semaphore(section_slots)
 
-    for idx, section in enumerate(sections):
-        if cancel_event and cancel_event.is_set():
-            break
+    async def _crawl_section(idx: int, section: dict):
+        nonlocal collected, reserved, in_flight, not_started
 
         section_name = section.get("name", f"栏目{idx + 1}")
         section_url = section.get("url", "")
         if not section_url:
-            continue
-
-        if on_progress:
-            await on_progress(f"Phase 1b: 采集栏目 ({idx + 1}/{len(sections)}): {section_name}")
-
-        # Build prompt with cross-section dedup URLs
-        section_prompt = build_section_prompt(
-            section_name=section_name,
-            section_url=section_url,
-            date_range=date_range,
-            max_items=max_items - len(all_items),  # remaining quota
-            existing_urls=list(collected_urls) if collected_urls else None,
-            crawl_rules=crawl_rules,
-        )
+            return
 
-        user_msg = f"请开始采集栏目「{section_name}」的列表页：{section_url}"
+        async with section_sem:
+            not_started -= 1
+            if cancel_event and cancel_event.is_set():
+                return
+            # Stop starting new sections once the quota is met or reserved
+            unreserved = max_items - collected - reserved
+            if unreserved <= 0:
+                return
+            # Split what is left with the sections that can start alongside this one
+            quota = -(-unreserved // min(section_slots - in_flight, not_started + 1))
+            reserved += quota
+            in_flight += 1
 
-        try:
-            agent_result = await run_agent(
-                source,
-                existing_urls=list(collected_urls),
-                on_progress=on_progress,
-                cancel_event=cancel_event,
-                system_prompt=section_prompt,
-                user_message=user_msg,
-                tools=CRAWLER_TOOLS,
-                max_turns=20,
-                enable_pruning=True,
+            if on_progress:
+                await on_progress(f"Phase 1b: 采集栏目 ({idx + 1}/{len(sections)}): {section_name}")
+
+            # Build prompt with URLs collected so far for cross-section dedup
+            section_prompt = build_section_prompt(
+                section_name=section_name,
+                section_url=section_url,
+                date_range=date_range,
+                max_items=quota,  # this section's share of the remaining quota
+                # The 100 most recently collected URLs (oldest first) fill the prompt cap
+                existing_urls=collected_url_list[-100:] or None,
                 crawl_rules=crawl_rules,
             )
 
-            # Collect items and update URL set for next section
-            section_item_count = 0
-            for item in agent_result.items:
-                url = item.get("url", "")
-                if url and url not in collected_urls:
-                    collected_urls.add(url)
-                    all_items.append(item)
-                    section_item_count += 1
-
-            # Record section history (consecutive empty count)
-            if source.id not in _section_history:
-                _section_history[source.id] = {}
-            if section_item_count > 0:
-                _section_history[source.id][section_url] = 0  # reset on success
-            else:
-                prev = _section_history[source.id].get(section_url, 0)
-                _section_history[source.id][section_url] = prev + 1
+            user_msg = f"请开始采集栏目「{section_name}」的列表页：{section_url}"
+
+            try:
+                agent_result = await run_agent(
+                    source,
+                    existing_urls=collected_url_list,
+                    on_progress=on_progress,
+                    cancel_event=cancel_event,
+                    system_prompt=section_prompt,
+                    user_message=user_msg,
+                    tools=CRAWLER_TOOLS,
+                    max_turns=20,
+                    enable_pruning=True,
+                    crawl_rules=crawl_rules,
+                )
+            except Exception as e:
+                logger.error("[%s] Section '%s' agent failed: %s", source.name, section_name, e)
+                reserved -= quota
+                in_flight -= 1
+                if on_progress:
+                    await on_progress(f"栏目 {section_name} 采集失败: {e}")
+                return
 
-            logger.info("[%s] Section '%s': %d items", source.name, section_name, section_item_count)
+        # Merge items, deduping against everything collected so far
+        section_item_count = 0
+        for item in agent_result.items:
+            url = item.get("url", "")
+            if url and url not in collected_urls:
+                collected_urls.add(url)
+                collected_url_list.append(url)
+                all_items.append(item)
+                section_item_count += 1
+        # Count what was found and give back the reservation
+        collected += section_item_count
+        reserved -= quota
+        in_flight -= 1
+
+        # Record section history (consecutive empty count)
+        history = _section_history[source.id]
+        if section_item_count > 0:
+            history[section_url] = 0  # reset on success
+        else:
+            history[section_url] += 1
 
-        except Exception as e:
-            logger.error("[%s] Section '%s' agent failed: %s", source.name, section_name, e)
-            if on_progress:
-                await on_progress(f"栏目 {section_name} 采集失败: {e}")
-            continue
+        logger.info("[%s] Section '%s': %d items", source.name, section_name, section_item_count)
 
-        # Stop if we've reached the max
-        if len(all_items) >= max_items:
-            break
+    await asyncio.gather(*(_crawl_section(idx, section) for idx, section in enumerate(sections)))
 
     return all_items
 
 
 ##############################################################################
-# Phase 2: Summary agent — concurrent simple_completion per item
+# Phase 2: Summary agent — batched simple_completion calls
 ##############################################################################
 
+# Items per batched summary request, and page text budget per item in a batch
+_SUMMARY_BATCH_SIZE = 5
+_SUMMARY_BATCH_BODY_CHARS = 1500
+
+_VALID_CONTENT_TYPES = ("policy", "notice", "news", "file")
+
+_SUMMARY_SYSTEM = (
+    "你是政策情报分析师，服务于咨询公司的行业顾问团队。\n"
+    "请根据提供的文章正文撰写一段简明摘要，准确判断内容类型（content_type），并提取与文章核心主题直接相关的关键词标签。\n"
+    "标签必须紧扣文章实际内容所属的行业领域和具体议题，不要套用与文章无关的热门标签。"
+)
+
+_SUMMARY_REQUIREMENTS = (
+    "- 内容类型（content_type）：根据文章性质准确判断，只能选以下之一：\n"
+    "  - policy：法律法规、国务院令、部委规章、条例、管理办法、指导意见、实施方案\n"
+    "  - notice：通知、公告、培训班通知、会议通知、人事任免、招标公告、公示\n"
+    "  - news：一般新闻报道、评论、分析、领导讲话、会议报道、工作动态\n"
+    "  - file：报告、白皮书、数据发布、统计公报、研究成果、规划文本\n"
+    "- 标签：2-3个与文章核心主题直接相关的关键词标签（如行业领域、政策类型、具体议题），"
+    "避免过于宽泛的标签。标签应反映文章来源网站的领域特征，"
+    "例如教育培训类网站的文章应使用继续教育、培训管理、学历提升等标签，"
+    "而非国企改革、人事等无关标签\n\n"
+)
+
+
+# "标签：a,b" line in a summary response, and the separators between its tags
+_TAG_LINE_RE = re.compile(r"^标签[:：]\s*(.*)$")
+_TAG_SPLIT_RE = re.compile(r"[,，、\s]+")
+
+
+def _normalize_tags(tag_part: str) -> str:
+    """Normalize a raw tag string to deduplicated comma-separated tags."""
+    # Split on any separator in one pass, drop empties, deduplicate preserving order
+    return ",".join(dict.fromkeys(t for t in _TAG_SPLIT_RE.split(tag_part) if t))
+
+
 def _parse_summary_and_tags(raw: str) -> tuple[str, str]:
     """Parse LLM response into (summary, comma_separated_tags).
 
@@ -636,151 +864,352 @@ def _parse_summary_and_tags(raw: str) -> tuple[str, str]:
     tags = ""
     summary_lines = []
     for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("标签：") or stripped.startswith("标签:"):
-            tag_part = stripped.split("：", 1)[-1] if "：" in stripped else stripped.split(":", 1)[-1]
-            # Normalize separators: 、 or space to comma
-            tag_part = tag_part.replace("、", ",").replace(" ", ",")
-            # Clean up: remove empty, strip whitespace, deduplicate
-            tag_list = [t.strip() for t in tag_part.split(",") if t.strip()]
-            tags = ",".join(dict.fromkeys(tag_list))  # deduplicate preserving order
+        m = _TAG_LINE_RE.match(line.strip())
+        if m:
+            tags = _normalize_tags(m.group(1))
         else:
             summary_lines.append(line)
     summary = "\n".join(summary_lines).strip()
     return summary, tags
 
 
+def _split_content_type(raw: str) -> tuple[str | None, str]:
+    """Pull the "content_type: xxx" line out of a summary response.
+
+    Returns (content_type or None, remaining text).
+    """
+    content_type = None
+    rest = []
+    for line in raw.split("\n"):
+        stripped = line.strip()
+        if stripped.lower().startswith("content_type:"):
+            ct_val = stripped.split(":", 1)[1].strip().lower()
+            if ct_val in _VALID_CONTENT_TYPES:
+                content_type = ct_val
+        else:
+            rest.append(line)
+    return content_type, "\n".join(rest)
+
+
+def _is_valid_summary(summary: str, title: str) -> bool:
+    return bool(summary) and summary != title.strip() and len(summary) >= 20
+
+
+def _apply_summary(item: dict, summary: str, tags: str, content_type: str | None) -> bool:
+    """Write a validated summary (plus tags/content_type) onto item; False if rejected."""
+    if not _is_valid_summary(summary, item.get("title", "")):
+        return False
+    item["summary"] = summary
+    if tags:
+        item["tags"] = tags
+    if content_type:
+        item["content_type"] = content_type
+    return True
+
+
+def _parse_batch_summaries(raw: str) -> dict[int, dict]:
+    """Parse a batched summary response: {"0": {"content_type", "summary", "tags"}, ...}."""
+    raw = _strip_code_fence(raw)
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        if "{" not in raw:
+            return {}
+        try:
+            data = _load_json_span(raw, "{", "}")
+        except json.JSONDecodeError:
+            return {}
+    if not isinstance(data, dict):
+        return {}
+
+    parsed: dict[int, dict] = {}
+    for key, entry in data.items():
+        try:
+            idx = int(key)
+        except (TypeError, ValueError):
+            continue
+        if isinstance(entry, dict):
+            parsed[idx] = entry
+    return parsed
+
+
+# Separators for the title-keyword tag fallback
+_TITLE_KEYWORD_SPLIT_RE = re.compile(r"[，,、：:|\s]+")
+
+# Cached summaries older than this are ignored and pruned
+_SUMMARY_CACHE_DAYS = 30
+
+# Hashes per IN (...) lookup, well under SQLite's bound-parameter limit
+_SUMMARY_CACHE_LOOKUP_CHUNK = 500
+
+
+def _url_hash(url: str) -> str:
+    return hashlib.sha256(_canon_url(url).encode()).hexdigest()
+
+
+def _content_hash(page_text: str) -> str:
+    """Hash of the article body as the batch summary prompt sees it."""
+    return hashlib.sha256(page_text[:_SUMMARY_BATCH_BODY_CHARS].encode()).hexdigest()
+
+
+async def _apply_cached_summaries(fetched: list[tuple[dict, str]]) -> list[tuple[dict, str]]:
+    """Fill in summaries from the summary cache for (item, page_text) pairs.
+
+    A cached summary is only reused if the article text is unchanged since it
+    was generated. Returns the pairs still missing a summary.
+    """
+    keyed = [(_url_hash(item["url"]), _content_hash(text), item, text) for item, text in fetched]
+    cutoff = datetime.utcnow() - timedelta(days=_SUMMARY_CACHE_DAYS)
+    cached = {}
+    try:
+        async with async_session() as session:
+            for start in range(0, len(keyed), _SUMMARY_CACHE_LOOKUP_CHUNK):
+                chunk = keyed[start:start + _SUMMARY_CACHE_LOOKUP_CHUNK]
+                result = await session.execute(
+                    select(SummaryCache.url_hash, SummaryCache.content_hash, SummaryCache.summary,
+                           SummaryCache.tags, SummaryCache.content_type)
+                    .where(SummaryCache.url_hash.in_([k[0] for k in chunk]),
+                           SummaryCache.updated_at >= cutoff)
+                )
+                cached.update((row.url_hash, row) for row in result)
+    except Exception as e:
+        logger.warning("Summary cache lookup failed: %s", e)
+        return fetched
+
+    remaining = []
+    for url_hash, content_hash, item, text in keyed:
+        row = cached.get(url_hash)
+        if not (
+            row and row.content_hash == content_hash
+            and _apply_summary(item, row.summary, row.tags, row.content_type or None)
+        ):
+            remaining.append((item, text))
+    return remaining
+
+
+async def _store_summaries(fetched: list[tuple[dict, str]]):
+    """Upsert the summaries of (item, page_text) pairs into the summary cache and prune stale entries."""
+    now = datetime.utcnow()
+    rows = [
+        {
+            "url_hash": _url_hash(item["url"]),
+            "content_hash": _content_hash(text),
+            "summary": item["summary"],
+            "tags": item.get("tags") or "",
+            "content_type": item.get("content_type") or "",
+            "updated_at": now,
+        }
+        for item, text in fetched if item.get("summary")
+    ]
+    if not rows:
+        return
+    stmt = sqlite_insert(SummaryCache)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SummaryCache.url_hash],
+        set_={
+            col: stmt.excluded[col]
+            for col in ("content_hash", "summary", "tags", "content_type", "updated_at")
+        },
+    )
+    try:
+        async with async_session() as session, session.begin():
+            await session.execute(stmt, rows)
+            await session.execute(delete(SummaryCache).where(
+                SummaryCache.updated_at < now - timedelta(days=_SUMMARY_CACHE_DAYS)
+            ))
+    except Exception as e:
+        logger.warning("Failed to cache %d summaries: %s", len(rows), e)
+
+
 async def _summarize_items(
     items: list[dict],
     cancel_event: asyncio.Event | None,
     on_progress=None,
+    llm_sem: asyncio.Semaphore | None = None,
+    label: str = "Phase 2",
 ):
     """Generate summaries for items that don't have one.
 
-    Each item gets an independent simple_completion call with clean context.
-    Runs with bounded concurrency (LLM_MAX_CONCURRENCY).
+    Runs as a two-stage pipeline: article pages are fetched concurrently
+    (BROWSE_MAX_CONCURRENCY) into a queue, and as soon as _SUMMARY_BATCH_SIZE
+    pages are ready they are summarized in one simple_completion call
+    (LLM_MAX_CONCURRENCY), so page loads overlap with LLM requests.
+    Items whose batched summary is missing or too short fall back to an
+    independent single-item call. Pages whose text is unchanged since an
+    earlier run summarized them (see _SUMMARY_CACHE_DAYS) reuse the cached
+    summary instead of an LLM call.
+    Concurrent passes over one source should share llm_sem so together they
+    stay within LLM_MAX_CONCURRENCY; label prefixes the progress lines.
     """
-    needs_summary = [i for i in items if not i.get("summary")]
+    needs_summary = [i for i in items if not i.get("summary") and i.get("url")]
     if not needs_summary:
         return
 
     if on_progress:
-        await on_progress(f"Phase 2: 为 {len(needs_summary)} 条内容生成摘要")
-    logger.info("Phase 2: generating summaries for %d items", len(needs_summary))
-
-    sem = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
-    summary_system = (
-        "你是政策情报分析师，服务于咨询公司的行业顾问团队。\n"
-        "请根据提供的文章正文撰写一段简明摘要，准确判断内容类型（content_type），并提取与文章核心主题直接相关的关键词标签。\n"
-        "标签必须紧扣文章实际内容所属的行业领域和具体议题，不要套用与文章无关的热门标签。"
-    )
+        await on_progress(f"{label}: 为 {len(needs_summary)} 条内容生成摘要")
+    logger.info("%s: generating summaries for %d items", label, len(needs_summary))
+
+    cached_count = 0
+    sem = llm_sem or asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    browse_sem = asyncio.BoundedSemaphore(BROWSE_MAX_CONCURRENCY)
+    fetched_queue: asyncio.Queue[tuple[dict, str]] = asyncio.Queue()
+    total_batches = -(-len(needs_summary) // _SUMMARY_BATCH_SIZE)
+
+    async def _fetch(item):
+        """Producer: load the article page and hand its body text (without the
+        link list) to the batcher ("" on failure)."""
+        page_text = ""
+        if not (cancel_event and cancel_event.is_set()):
+            async with browse_sem:
+                try:
+                    page_text = await browse_page(item["url"])
+                except Exception as e:
+                    logger.warning("Summary page fetch failed for %s: %s", item["url"], e)
+            if not page_text or "页面加载失败" in page_text:
+                page_text = ""
+            page_text = page_text.partition(_LINKS_MARKER)[0].strip()
+        await fetched_queue.put((item, page_text))
+
+    async def _summarize_single(item, page_text):
+        url = item["url"]
+        title = item.get("title", "")
+        user_prompt = (
+            f"请为以下文章撰写摘要、判断内容类型并提取关键词标签。\n\n"
+            f"要求：\n"
+            f"- 摘要：2-3句话，100-200字，提炼核心政策要点、关键数据或主要措施，不要重复标题\n"
+            f"{_SUMMARY_REQUIREMENTS}"
+            f"输出格式（严格遵守）：\n"
+            f"content_type: policy/notice/news/file\n"
+            f"摘要正文内容...\n"
+            f"标签：关键词1,关键词2,关键词3\n\n"
+            f"标题：{title}\n"
+            f"来源URL：{url}\n\n"
+            f"正文：\n{page_text[:6000]}"
+        )
+        async with sem:
+            try:
+                for temperature in (0.2, 0.3):  # one retry with a bit more variety
+                    raw = await simple_completion(
+                        user_prompt, system=_SUMMARY_SYSTEM, temperature=temperature, max_tokens=512
+                    )
+                    content_type, raw_for_parse = _split_content_type(raw.strip())
+                    summary, tags = _parse_summary_and_tags(raw_for_parse)
+                    if _apply_summary(item, summary, tags, content_type):
+                        return
+            except Exception as e:
+                logger.warning("Summary failed for %s: %s", url, e)
 
-    async def _process_one(item, idx):
+    async def _process_batch(fetched, bidx):
+        nonlocal cached_count
         if cancel_event and cancel_event.is_set():
             return
-        url = item.get("url", "")
-        title = item.get("title", "")
-        if not url:
+
+        uncached = await _apply_cached_summaries(fetched)
+        cached_count += len(fetched) - len(uncached)
+        fetched = uncached
+        if not fetched:
             return
 
         async with sem:
-            try:
-                if on_progress:
-                    await on_progress(f"摘要 ({idx + 1}/{len(needs_summary)}): {title[:50]}")
-
-                page_text = await browse_page(url)
-                if not page_text or "页面加载失败" in page_text:
-                    return
-
-                user_prompt = (
-                    f"请为以下文章撰写摘要、判断内容类型并提取关键词标签。\n\n"
-                    f"要求：\n"
-                    f"- 摘要：2-3句话，100-200字，提炼核心政策要点、关键数据或主要措施，不要重复标题\n"
-                    f"- 内容类型（content_type）：根据文章性质准确判断，只能选以下之一：\n"
-                    f"  - policy：法律法规、国务院令、部委规章、条例、管理办法、指导意见、实施方案\n"
-                    f"  - notice：通知、公告、培训班通知、会议通知、人事任免、招标公告、公示\n"
-                    f"  - news：一般新闻报道、评论、分析、领导讲话、会议报道、工作动态\n"
-                    f"  - file：报告、白皮书、数据发布、统计公报、研究成果、规划文本\n"
-                    f"- 标签：2-3个与文章核心主题直接相关的关键词标签（如行业领域、政策类型、具体议题），"
-                    f"避免过于宽泛的标签。标签应反映文章来源网站的领域特征，"
-                    f"例如教育培训类网站的文章应使用继续教育、培训管理、学历提升等标签，"
-                    f"而非国企改革、人事等无关标签\n\n"
-                    f"输出格式（严格遵守）：\n"
-                    f"content_type: policy/notice/news/file\n"
-                    f"摘要正文内容...\n"
-                    f"标签：关键词1,关键词2,关键词3\n\n"
-                    f"标题：{title}\n"
-                    f"来源URL：{url}\n\n"
-                    f"正文：\n{page_text[:6000]}"
+            if on_progress:
+                await on_progress(
+                    f"摘要批次 ({bidx + 1}/{total_batches}): {len(fetched)} 条，"
+                    f"首条 {fetched[0][0].get('title', '')[:40]}"
                 )
 
+            blocks = []
+            for i, (item, text) in enumerate(fetched):
+                blocks.append(
+                    f"[{i}] 标题：{item.get('title', '')}\n"
+                    f"来源URL：{item['url']}\n"
+                    f"正文：\n{text[:_SUMMARY_BATCH_BODY_CHARS]}"
+                )
+            user_prompt = (
+                f"请为以下 {len(fetched)} 篇文章分别撰写摘要、判断内容类型并提取关键词标签。\n\n"
+                f"要求：\n"
+                f"- 摘要：每篇2-3句话，100-200字，提炼核心政策要点、关键数据或主要措施，不要重复标题\n"
+                f"{_SUMMARY_REQUIREMENTS}"
+                f"输出格式（严格遵守）：只输出一个JSON对象，键为文章编号，不加其他内容，如\n"
+                f'{{"0": {{"content_type": "policy", "summary": "摘要正文", "tags": "关键词1,关键词2"}}}}\n\n'
+                + "\n\n".join(blocks)
+            )
+            try:
                 raw = await simple_completion(
-                    user_prompt, system=summary_system, temperature=0.2, max_tokens=512
+                    user_prompt, system=_SUMMARY_SYSTEM, temperature=0.2,
+                    max_tokens=400 * len(fetched) + 200,
                 )
-                raw = raw.strip()
-
-                # Extract content_type line before parsing summary/tags
-                content_type = None
-                ct_lines = []
-                for _line in raw.split("\n"):
-                    _stripped = _line.strip()
-                    if _stripped.lower().startswith("content_type:"):
-                        ct_val = _stripped.split(":", 1)[1].strip().lower()
-                        if ct_val in ("policy", "notice", "news", "file"):
-                            content_type = ct_val
-                    else:
-                        ct_lines.append(_line)
-                raw_for_parse = "\n".join(ct_lines)
-
-                # Parse tags from response
-                summary, tags = _parse_summary_and_tags(raw_for_parse)
-
-                # Validate
-                if not summary or summary == title.strip() or len(summary) < 20:
-                    # Retry once
-                    raw = await simple_completion(
-                        user_prompt, system=summary_system, temperature=0.3, max_tokens=512
-                    )
-                    raw = raw.strip()
-
-                    # Re-extract content_type from retry
-                    ct_lines = []
-                    for _line in raw.split("\n"):
-                        _stripped = _line.strip()
-                        if _stripped.lower().startswith("content_type:"):
-                            ct_val = _stripped.split(":", 1)[1].strip().lower()
-                            if ct_val in ("policy", "notice", "news", "file"):
-                                content_type = ct_val
-                        else:
-                            ct_lines.append(_line)
-                    raw_for_parse = "\n".join(ct_lines)
-                    summary, tags = _parse_summary_and_tags(raw_for_parse)
-
-                if summary and summary != title.strip() and len(summary) >= 20:
-                    item["summary"] = summary
-                    if tags:
-                        item["tags"] = tags
-                    if content_type:
-                        item["content_type"] = content_type
+                parsed = _parse_batch_summaries(raw)
             except Exception as e:
-                logger.warning("Summary failed for %s: %s", url, e)
+                logger.warning("Batch summary failed (%d items): %s", len(fetched), e)
+                parsed = {}
+
+        retry = []
+        for i, (item, text) in enumerate(fetched):
+            entry = parsed.get(i, {})
+            ct = str(entry.get("content_type") or "").strip().lower()
+            tags = entry.get("tags") or ""
+            if isinstance(tags, list):
+                tags = ",".join(str(t) for t in tags)
+            applied = _apply_summary(
+                item,
+                str(entry.get("summary") or "").strip(),
+                _normalize_tags(str(tags)),
+                ct if ct in _VALID_CONTENT_TYPES else None,
+            )
+            if not applied:
+                retry.append((item, text))
 
-    await asyncio.gather(
-        *[_process_one(item, idx) for idx, item in enumerate(needs_summary)],
-        return_exceptions=True,
-    )
+        # Fallback: independent single-item calls for anything the batch missed
+        for item, text in retry:
+            if cancel_event and cancel_event.is_set():
+                break
+            await _summarize_single(item, text)
+
+        await _store_summaries(fetched)
+
+    async def _watch_cancel():
+        """Abort the whole TaskGroup (in-flight fetches and LLM calls) on user cancel."""
+        await cancel_event.wait()
+        raise _CancelRequested
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            watchdog = tg.create_task(_watch_cancel()) if cancel_event else None
+            for item in needs_summary:
+                tg.create_task(_fetch(item))
+
+            # Consumer: group fetched pages into batches in completion order
+            batch_tasks = []
+            pending: list[tuple[dict, str]] = []
+            for received in range(1, len(needs_summary) + 1):
+                item, page_text = await fetched_queue.get()
+                if page_text:
+                    pending.append((item, page_text))
+                if pending and (len(pending) >= _SUMMARY_BATCH_SIZE or received == len(needs_summary)):
+                    batch_tasks.append(tg.create_task(_process_batch(pending, len(batch_tasks))))
+                    pending = []
+            if batch_tasks:
+                await asyncio.wait(batch_tasks)
+            if watchdog:
+                watchdog.cancel()
+    except* _CancelRequested:
+        logger.info("%s cancelled", label)
 
     generated = sum(1 for i in needs_summary if i.get("summary"))
+    if cached_count:
+        if on_progress:
+            await on_progress(f"{label}: 复用 {cached_count} 条内容未变的已缓存摘要")
+        logger.info("%s: %d summaries taken from cache", label, cached_count)
     if on_progress:
-        await on_progress(f"Phase 2: 完成，{generated}/{len(needs_summary)} 条摘要生成成功")
-    logger.info("Phase 2 done: %d/%d summaries generated", generated, len(needs_summary))
+        await on_progress(f"{label}: 完成，{generated}/{len(needs_summary)} 条摘要生成成功")
+    logger.info("%s done: %d/%d summaries generated", label, generated, len(needs_summary))
 
     # Fallback: generate tags from title if LLM didn't provide any
     for item in items:
         if not item.get("tags"):
             title = item.get("title", "")
             # Simple keyword extraction from title
-            keywords = [w for w in re.split(r'[，,、：:|\s]+', title) if len(w) >= 2 and len(w) <= 8][:3]
+            keywords = [w for w in _TITLE_KEYWORD_SPLIT_RE.split(title) if len(w) >= 2 and len(w) <= 8][:3]
             if keywords:
                 item["tags"] = ",".join(keywords)
 
@@ -789,106 +1218,178 @@ async def _summarize_items(
 # Phase 3: Ranking agent — single simple_completion
 ##############################################################################
 
-async def _rank_items(items: list[dict], on_progress=None) -> list[dict]:
-    """Rank items by strategic importance using a single LLM call.
+# Everything that doesn't depend on the items lives in the system prompt, so
+# every ranking call shares one long identical prefix that providers with
+# prompt/prefix caching can reuse; the user message only carries the items.
+_RANK_SYSTEM = (
+    "你是咨询公司高级政策顾问，负责为企业客户筛选和排序政策情报。你非常善于区分国家级和地方级内容的重要性差异。\n\n"
+    "你的任务：将用户给出的政策/新闻条目按战略重要性从高到低排序。\n\n"
+    "排序原则（严格按层级排序，高层级的一定排在低层级前面）：\n\n"
+    "第一层（最重要）：\n"
+    "- 国家层面重大政策：国务院、部委发布的法律法规、规划纲要、指导意见、改革方案\n"
+    "- 高级领导人（国家级、部级）讲话、批示、署名文章\n"
+    "- 高级领导人事任免（部级及以上）\n\n"
+    "第二层：\n"
+    "- 全国性重要会议（国务院常务会议、部委工作会议、全国性行业会议）\n"
+    "- 全国性重大新闻（全国数据发布、重大项目、行业里程碑）\n"
+    "- 国家级行业标准、规范发布\n\n"
+    "第三层：\n"
+    "- 部委通知、公告\n"
+    "- 行业统计数据、发展报告\n"
+    "- 政策解读、答记者问\n\n"
+    "第四层：\n"
+    "- 地方性政策文件、省级通知\n"
+    "- 地方项目核准、地方会议\n\n"
+    "第五层（最不重要）：\n"
+    "- 地方监管局日常工作动态\n"
+    "- 来访接待、调研视察（非高级领导）\n"
+    "- 一般性工作简报\n\n"
+    "关键判断方法：标题中含有\"国务院\"\"国家\"\"全国\"\"部\"等关键词的通常是第一、二层；含有省份名、\"XX局\"\"XX办\"等地方机构名的通常是第四、五层。\n"
+    "同一层级内，日期较新的优先。\n\n"
+    "请只返回排序后的编号JSON数组，如 [3, 0, 7, 1, 5]\n"
+    "不要输出任何其他内容。"
+)
+_RANK_USER_TEMPLATE = (
+    "请将以下{count}条政策/新闻条目按战略重要性从高到低排序，只返回编号JSON数组。\n\n"
+    "条目列表：\n{items_text}"
+)
+
+
+# Above this many items, ranking is split into tiles ranked concurrently, so
+# no single prompt (or its index-array reply) grows with max_items
+_RANK_TILE_SIZE = 40
 
-    Falls back to date-descending order on failure.
+# Title keywords hinting at national-level (tier 1-2) items; used to order
+# tiles when an oversize batch is split
+_RANK_NATIONAL_HINTS = ("国务院", "中共中央", "国家", "全国")
+
+
+def _rank_tiles(items: list[dict]) -> list[list[dict]]:
+    """Split an oversize rank batch into tiles of at most _RANK_TILE_SIZE items.
+
+    Items with a national-level title hint come first, so the ranked tiles
+    concatenate roughly in tier order; each group is tiled newest first.
     """
-    if len(items) <= 1:
-        return items
+    national: list[dict] = []
+    other: list[dict] = []
+    for item in items:
+        title = item.get("title", "")
+        (national if any(h in title for h in _RANK_NATIONAL_HINTS) else other).append(item)
+
+    tiles = []
+    for group in (national, other):
+        group.sort(key=_date_sort_key, reverse=True)
+        tiles.extend(group[k:k + _RANK_TILE_SIZE] for k in range(0, len(group), _RANK_TILE_SIZE))
+    return tiles
 
-    if on_progress:
-        await on_progress("Phase 3: 按战略重要性排序")
-    logger.info("Phase 3: ranking %d items", len(items))
 
+async def _rank_tile(items: list[dict]) -> list[dict] | None:
+    """Rank one prompt's worth of items; None if the LLM call or its output fails."""
     # Build compact text: [i] [type] date | title — summary[:80]
-    type_map = {"news": "新闻", "policy": "政策", "notice": "通知", "file": "文件"}
-    lines = []
-    for i, item in enumerate(items):
-        type_label = type_map.get(item.get("content_type", ""), "内容")
-        d = item.get("published_date", "")
-        title = item.get("title", "")
-        summary_snippet = (item.get("summary") or "")[:80]
-        line = f"[{i}] [{type_label}] {d} | {title}"
-        if summary_snippet:
-            line += f" — {summary_snippet}"
-        lines.append(line)
-
-    items_text = "\n".join(lines)
-
-    system = "你是咨询公司高级政策顾问，负责为企业客户筛选和排序政策情报。你非常善于区分国家级和地方级内容的重要性差异。"
-    user = (
-        f"请将以下{len(items)}条政策/新闻条目按战略重要性从高到低排序。\n\n"
-        f"排序原则（严格按层级排序，高层级的一定排在低层级前面）：\n\n"
-        f"第一层（最重要）：\n"
-        f"- 国家层面重大政策：国务院、部委发布的法律法规、规划纲要、指导意见、改革方案\n"
-        f"- 高级领导人（国家级、部级）讲话、批示、署名文章\n"
-        f"- 高级领导人事任免（部级及以上）\n\n"
-        f"第二层：\n"
-        f"- 全国性重要会议（国务院常务会议、部委工作会议、全国性行业会议）\n"
-        f"- 全国性重大新闻（全国数据发布、重大项目、行业里程碑）\n"
-        f"- 国家级行业标准、规范发布\n\n"
-        f"第三层：\n"
-        f"- 部委通知、公告\n"
-        f"- 行业统计数据、发展报告\n"
-        f"- 政策解读、答记者问\n\n"
-        f"第四层：\n"
-        f"- 地方性政策文件、省级通知\n"
-        f"- 地方项目核准、地方会议\n\n"
-        f"第五层（最不重要）：\n"
-        f"- 地方监管局日常工作动态\n"
-        f"- 来访接待、调研视察（非高级领导）\n"
-        f"- 一般性工作简报\n\n"
-        f"关键判断方法：标题中含有\"国务院\"\"国家\"\"全国\"\"部\"等关键词的通常是第一、二层；含有省份名、\"XX局\"\"XX办\"等地方机构名的通常是第四、五层。\n"
-        f"同一层级内，日期较新的优先。\n\n"
-        f"请只返回排序后的编号JSON数组，如 [3, 0, 7, 1, 5]\n"
-        f"不要输出任何其他内容。\n\n"
-        f"条目列表：\n{items_text}"
+    items_text = "\n".join(
+        f"[{i}] [{_CONTENT_TYPE_LABELS.get(item.get('content_type', ''), '内容')}] "
+        f"{item.get('published_date', '')} | {item.get('title', '')}"
+        + (f" — {snippet}" if (snippet := (item.get("summary") or "")[:80]) else "")
+        for i, item in enumerate(items)
     )
 
-    try:
-        raw = await simple_completion(user, system=system, temperature=0.1, max_tokens=1024)
-        raw = raw.strip()
-        if raw.startswith("```"):
-            raw = re.sub(r"^```\w*\n?", "", raw)
-            raw = re.sub(r"\n?```$", "", raw)
-            raw = raw.strip()
-
-        sorted_indices = json.loads(raw)
-
-        if isinstance(sorted_indices, list):
-            # Validate: integers in range
-            valid = [i for i in sorted_indices if isinstance(i, int) and 0 <= i < len(items)]
-            # Append any missing indices
-            seen = set(valid)
-            for i in range(len(items)):
-                if i not in seen:
-                    valid.append(i)
-
-            ranked = [items[i] for i in valid]
-            if on_progress:
-                await on_progress("Phase 3: 排序完成")
-            logger.info("Phase 3: ranking succeeded")
-            return ranked
+    user = _RANK_USER_TEMPLATE.format(count=len(items), items_text=items_text)
 
+    try:
+        raw = await simple_completion(user, system=_RANK_SYSTEM, temperature=0.1, max_tokens=1024)
+        sorted_indices = _load_json_span(_strip_code_fence(raw))
     except (json.JSONDecodeError, Exception) as e:
         logger.warning("Phase 3 ranking failed, falling back to date sort: %s", e)
+        return None
+    if not isinstance(sorted_indices, list):
+        return None
+
+    # Validate: integers in range, each once; append any missing indices
+    valid = list(dict.fromkeys(
+        i for i in sorted_indices if isinstance(i, int) and 0 <= i < len(items)
+    ))
+    seen = set(valid)
+    valid.extend(i for i in range(len(items)) if i not in seen)
+    return [items[i] for i in valid]
+
+
+async def _rank_items(items: list[dict], on_progress=None) -> list[dict]:
+    """Rank items by strategic importance with the LLM.
+
+    Up to _RANK_TILE_SIZE items are ranked in a single call; larger batches
+    are split by _rank_tiles and the tiles ranked concurrently.
+    Falls back to date-descending order (per tile) on failure.
+    """
+    if len(items) <= 1:
+        return items
 
-    # Fallback: sort by date descending
     if on_progress:
-        await on_progress("Phase 3: 排序失败，降级为按日期排序")
+        await on_progress("Phase 3: 按战略重要性排序")
+    logger.info("Phase 3: ranking %d items", len(items))
 
-    def sort_key(item):
-        d = item.get("published_date", "")
-        return d if d else "0000-00-00"
-    items.sort(key=sort_key, reverse=True)
-    return items
+    tiles = [items] if len(items) <= _RANK_TILE_SIZE else _rank_tiles(items)
+    results = await asyncio.gather(*(_rank_tile(tile) for tile in tiles))
+
+    ranked: list[dict] = []
+    failed = 0
+    for tile, result in zip(tiles, results):
+        if result is None:
+            failed += 1
+            result = sorted(tile, key=_date_sort_key, reverse=True)
+        ranked.extend(result)
+
+    if failed == len(tiles):
+        if on_progress:
+            await on_progress("Phase 3: 排序失败，降级为按日期排序")
+    else:
+        if on_progress:
+            await on_progress("Phase 3: 排序完成")
+        logger.info("Phase 3: ranking succeeded (%d/%d tiles)", len(tiles) - failed, len(tiles))
+    return ranked
 
 
 ##############################################################################
 # Main pipeline: _run_single_source
 ##############################################################################
 
+_PROGRESS_FLUSH_INTERVAL = 0.5  # seconds to coalesce progress lines per DB write
+
+
+async def _progress_writer(task_id: int, queue: asyncio.Queue):
+    """Append queued progress lines to the task's progress_log in batches.
+
+    Lines arriving within _PROGRESS_FLUSH_INTERVAL are written with a single
+    UPDATE. A None entry flushes what is pending and stops the writer.
+    """
+    done = False
+    while not done:
+        line = await queue.get()
+        lines = []
+        if line is None:
+            done = True
+        else:
+            lines.append(line)
+            await asyncio.sleep(_PROGRESS_FLUSH_INTERVAL)
+        while not queue.empty():
+            line = queue.get_nowait()
+            if line is None:
+                done = True
+            else:
+                lines.append(line)
+
+        if lines:
+            try:
+                async with async_session() as session:
+                    await session.execute(
+                        update(CrawlTask)
+                        .where(CrawlTask.id == task_id)
+                        .values(progress_log=func.coalesce(CrawlTask.progress_log, "") + "".join(lines))
+                    )
+                    await session.commit()
+            except Exception:
+                pass
+
+
 async def _run_single_source(source: MonitorSource, task_id: int, batch_id: str, user_id: int = 1):
     """Run the 4-phase pipeline for a single source and persist results."""
     cancel_event = asyncio.Event()
@@ -896,23 +1397,25 @@ async def _run_single_source(source: MonitorSource, task_id: int, batch_id: str,
 
     # Mark task as running
     async with async_session() as session:
-        task = await session.get(CrawlTask, task_id)
-        task.status = TaskStatus.running.value
-        task.started_at = datetime.utcnow()
+        await session.execute(
+            update(CrawlTask)
+            .where(CrawlTask.id == task_id)
+            .values(status=TaskStatus.running.value, started_at=datetime.utcnow())
+        )
         await session.commit()
 
+    # Progress lines are queued and appended to progress_log by one writer
+    progress_queue: asyncio.Queue[str | None] = asyncio.Queue()
+    progress_writer = asyncio.create_task(_progress_writer(task_id, progress_queue))
+
+    homepage_summary_task: asyncio.Task | None = None
     try:
         async def _on_progress(msg: str):
-            try:
-                async with async_session() as sess:
-                    t = await sess.get(CrawlTask, task_id)
-                    timestamp = datetime.utcnow().strftime("%H:%M:%S")
-                    t.progress_log = (t.progress_log or "") + f"[{timestamp}] {msg}\n"
-                    await sess.commit()
-            except Exception:
-                pass
+            timestamp = datetime.utcnow().strftime("%H:%M:%S")
+            progress_queue.put_nowait(f"[{timestamp}] {msg}\n")
 
         existing_urls = await _get_existing_urls(source.id)
+        existing_url_set = {_canon_url(u) for u in existing_urls}
         max_items = source.max_items or 30
         crawl_rules = source.crawl_rules or DEFAULT_CRAWL_RULES
 
@@ -938,22 +1441,42 @@ async def _run_single_source(source: MonitorSource, task_id: int, batch_id: str,
         if not homepage_text or "页面加载失败" in homepage_text:
             homepage_text = ""
 
-        # Step 1: Extract directly-harvestable items (pure code, no LLM)
         # Disable domain filter if crawl_rules allow cross-domain content
         effective_source_url = "" if "允许跨域" in crawl_rules else source.url
-        homepage_items = _extract_homepage_items(homepage_text, date_start, date_end, source_url=effective_source_url) if homepage_text else []
-
-        # Step 2: Identify sections via LLM (with crawl_rules injection)
-        sections = await _identify_sections(homepage_text, source, on_progress=_on_progress) if homepage_text else [{"name": source.name, "url": source.url}]
+        link_section, items_blob = _split_homepage(homepage_text)
 
-        await _on_progress(f"Phase 1a: 首页提取 {len(homepage_items)} 条条目，{len(sections)} 个栏目")
+        async def _homepage_items() -> tuple[int, list[dict]]:
+            """Steps 1 + 3: extract items (pure code), then LLM-filter them.
 
-        # Step 3: LLM quality filter — apply crawl_rules to homepage items
-        if homepage_items:
-            homepage_items = await _filter_homepage_items(
-                homepage_items, crawl_rules, on_progress=_on_progress,
-            )
+            Returns (extracted count, kept items).
+            """
+            if len(items_blob) > _OFFLOAD_MIN_CHARS:
+                items = await asyncio.to_thread(
+                    _extract_homepage_items, items_blob, date_start, date_end, effective_source_url,
+                )
+            else:
+                items = _extract_homepage_items(items_blob, date_start, date_end, source_url=effective_source_url)
+            extracted = len(items)
+            # Step 3: LLM quality filter — apply crawl_rules to homepage items
+            if items:
+                items = await _filter_homepage_items(
+                    items, crawl_rules, on_progress=_on_progress, max_items=max_items,
+                )
+            return extracted, items
+
+        async def _homepage_sections() -> list[dict]:
+            """Step 2: identify sections via LLM (with crawl_rules injection);
+            without a link list, the top of the page text stands in for it."""
+            if not homepage_text:
+                return [{"name": source.name, "url": source.url}]
+            return await _identify_sections(link_section or homepage_text[:8000], source, on_progress=_on_progress)
+
+        # Items and sections don't depend on each other: overlap their LLM calls
+        (extracted_count, homepage_items), sections = await asyncio.gather(
+            _homepage_items(), _homepage_sections(),
+        )
 
+        await _on_progress(f"Phase 1a: 首页提取 {extracted_count} 条条目，{len(sections)} 个栏目")
         await _on_progress(f"Phase 1a: 筛选后保留 {len(homepage_items)} 条首页条目")
 
         if is_cancel_requested(task_id):
@@ -971,10 +1494,11 @@ async def _run_single_source(source: MonitorSource, task_id: int, batch_id: str,
             history = _section_history.get(source.id, {})
             if history and homepage_text:
                 before_filter = len(sections)
-                sections = [
-                    s for s in sections
-                    if history.get(s.get("url", ""), 0) < _SECTION_SKIP_THRESHOLD
-                ]
+                skip_urls = frozenset(
+                    url for url, empty_runs in history.items() if empty_runs >= _SECTION_SKIP_THRESHOLD
+                )
+                if skip_urls:
+                    sections = [s for s in sections if s.get("url", "") not in skip_urls]
                 skipped = before_filter - len(sections)
                 if skipped > 0:
                     logger.info("[%s] Skipped %d sections (empty %d+ consecutive runs)", source.name, skipped, _SECTION_SKIP_THRESHOLD)
@@ -983,15 +1507,29 @@ async def _run_single_source(source: MonitorSource, task_id: int, batch_id: str,
             sections_to_crawl = sections[:MAX_SECTIONS]
             await _on_progress(f"Phase 1b: 补充采集 {len(sections_to_crawl)} 个栏目")
 
+        # One LLM limit for both summary passes (early homepage + Phase 2)
+        llm_sem = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        new_homepage_items: list[dict] = []
         section_items = []
         if sections_to_crawl:
-            # Pass homepage item URLs to avoid duplicates
-            homepage_urls = [item.get("url", "") for item in homepage_items]
-            combined_existing = existing_urls + homepage_urls
-
+            # Summarize new homepage items (Phase 2) while sections are being
+            # crawled; the Phase 2 pass below skips items that already have one
+            new_homepage_items = [
+                item for item in homepage_items
+                if _canon_url(item.get("url", "")) not in existing_url_set
+            ]
+            if new_homepage_items:
+                homepage_summary_task = asyncio.create_task(_summarize_items(
+                    new_homepage_items, cancel_event, on_progress=_on_progress,
+                    llm_sem=llm_sem, label="Phase 1b 首页摘要",
+                ))
+
+            # History is checked in-process; only homepage item URLs go into prompts
             section_items = await _crawl_all_sections(
-                source, sections_to_crawl, combined_existing, cancel_event,
+                source, sections_to_crawl, existing_urls, cancel_event,
                 on_progress=_on_progress, crawl_rules=crawl_rules,
+                max_items=remaining,
+                seed_urls=[item["url"] for item in homepage_items if item.get("url")],
             )
 
         if is_cancel_requested(task_id):
@@ -1000,17 +1538,18 @@ async def _run_single_source(source: MonitorSource, task_id: int, batch_id: str,
 
         # Merge and deduplicate
         all_items = homepage_items + section_items
-        existing_url_set = set(u.replace("http://", "https://") for u in existing_urls)
         seen_urls = set()
         seen_titles = set()
         deduped_items = []
-        from app.agent.domain_filter import is_same_domain
+        from app.agent.domain_filter import DomainFilter
+        # Source host/root parsed once; item hosts are memoized per instance
+        domain_filter = DomainFilter(effective_source_url)
         for item in all_items:
             url = item.get("url", "")
-            norm_url = url.replace("http://", "https://")
+            norm_url = _canon_url(url)
             if norm_url in existing_url_set or norm_url in seen_urls:
                 continue
-            if url and effective_source_url and not is_same_domain(url, effective_source_url):
+            if not domain_filter.is_same_domain(url):
                 continue
             # Title-based dedup
             norm_title = item.get("title", "").strip().lower()
@@ -1021,20 +1560,27 @@ async def _run_single_source(source: MonitorSource, task_id: int, batch_id: str,
                 seen_titles.add(norm_title)
             deduped_items.append(item)
 
-        # Trim to max_items
+        # Trim to max_items (newest first; same result as a full sort + slice).
+        # Homepage items already being summarized are kept (they number fewer
+        # than max_items whenever sections were crawled) so no summary is wasted;
+        # section items fill the rest of the quota.
         if len(deduped_items) > max_items:
-            def sort_key(item):
-                d = item.get("published_date", "")
-                return d if d else "0000-00-00"
-            deduped_items.sort(key=sort_key, reverse=True)
-            deduped_items = deduped_items[:max_items]
+            early_ids = {id(item) for item in new_homepage_items}
+            kept = [item for item in deduped_items if id(item) in early_ids]
+            rest = [item for item in deduped_items if id(item) not in early_ids]
+            deduped_items = sorted(
+                kept + heapq.nlargest(max_items - len(kept), rest, key=_date_sort_key),
+                key=_date_sort_key, reverse=True,
+            )
 
         # ── Phase 2: Summary generation ──
         if is_cancel_requested(task_id):
             logger.info("[%s] Task %d cancelled", source.name, task_id)
             return
 
-        await _summarize_items(deduped_items, cancel_event, on_progress=_on_progress)
+        if homepage_summary_task:
+            await homepage_summary_task
+        await _summarize_items(deduped_items, cancel_event, on_progress=_on_progress, llm_sem=llm_sem)
 
         # ── Phase 3: Strategic ranking ──
         if is_cancel_requested(task_id):
@@ -1048,40 +1594,40 @@ async def _run_single_source(source: MonitorSource, task_id: int, batch_id: str,
             logger.info("[%s] Task %d cancelled", source.name, task_id)
             return
 
+        rows = [
+            {
+                "task_id": task_id,
+                "source_id": source.id,
+                "title": _clean_title(item["title"]),
+                "url": item["url"],
+                "content_type": item.get("content_type", "news"),
+                "summary": item.get("summary", ""),
+                "tags": item.get("tags", ""),
+                "has_attachment": item.get("has_attachment", False),
+                "attachment_name": item.get("attachment_name", ""),
+                "attachment_type": item.get("attachment_type", ""),
+                "attachment_path": item.get("attachment_path", ""),
+                "attachment_summary": item.get("attachment_summary", ""),
+                "published_date": _parse_iso_date(item.get("published_date")),
+                "user_id": user_id,
+            }
+            for item in deduped_items
+        ]
+        # Single executemany INSERT, and mark the task completed in the same transaction.
+        # The table-level insert takes the Core path: no per-row ORM bulk-insert
+        # processing of the dicts.
         async with async_session() as session:
-            for item in deduped_items:
-                pub_date = None
-                if item.get("published_date"):
-                    try:
-                        pub_date = date.fromisoformat(item["published_date"])
-                    except ValueError:
-                        pass
-
-                cr = CrawlResult(
-                    task_id=task_id,
-                    source_id=source.id,
-                    title=_clean_title(item["title"]),
-                    url=item["url"],
-                    content_type=item.get("content_type", "news"),
-                    summary=item.get("summary", ""),
-                    tags=item.get("tags", ""),
-                    has_attachment=item.get("has_attachment", False),
-                    attachment_name=item.get("attachment_name", ""),
-                    attachment_type=item.get("attachment_type", ""),
-                    attachment_path=item.get("attachment_path", ""),
-                    attachment_summary=item.get("attachment_summary", ""),
-                    published_date=pub_date,
-                    user_id=user_id,
+            if rows:
+                await session.execute(CrawlResult.__table__.insert(), rows)
+            await session.execute(
+                update(CrawlTask)
+                .where(CrawlTask.id == task_id)
+                .values(
+                    status=TaskStatus.completed.value,
+                    completed_at=datetime.utcnow(),
+                    items_found=len(deduped_items),
                 )
-                session.add(cr)
-            await session.commit()
-
-        # Mark task as completed
-        async with async_session() as session:
-            task = await session.get(CrawlTask, task_id)
-            task.status = TaskStatus.completed.value
-            task.completed_at = datetime.utcnow()
-            task.items_found = len(deduped_items)
+            )
             await session.commit()
 
         logger.info("[%s] Pipeline done: %d items persisted", source.name, len(deduped_items))
@@ -1089,78 +1635,226 @@ async def _run_single_source(source: MonitorSource, task_id: int, batch_id: str,
     except Exception as e:
         logger.error("[%s] Pipeline crashed: %s", source.name, e)
         async with async_session() as session:
-            task = await session.get(CrawlTask, task_id)
-            task.status = TaskStatus.failed.value
-            task.completed_at = datetime.utcnow()
-            task.error_log = str(e)
+            await session.execute(
+                update(CrawlTask)
+                .where(CrawlTask.id == task_id)
+                .values(status=TaskStatus.failed.value, completed_at=datetime.utcnow(), error_log=str(e))
+            )
             await session.commit()
     finally:
+        if homepage_summary_task and not homepage_summary_task.done():
+            homepage_summary_task.cancel()
+        # Flush remaining progress lines
+        progress_queue.put_nowait(None)
+        await asyncio.gather(progress_writer, return_exceptions=True)
         _cancel_flags.pop(task_id, None)
 
 
-async def _generate_overview(by_source: dict[str, list[CrawlResult]]) -> str:
-    """Use LLM to generate a structured overview of all results."""
-    # Dynamic per-source limit to keep total items manageable
-    total_items = sum(len(items) for items in by_source.values())
-    per_source_limit = 60 // max(len(by_source), 1) if total_items > 60 else 999
-
-    summary_parts = []
-    for src_name, items in by_source.items():
-        summary_parts.append(f"【{src_name}】共{len(items)}条:")
-        for item in items[:per_source_limit]:
-            line = f"- [{item.content_type}] {item.title}"
-            if item.published_date:
-                line += f" ({item.published_date})"
-            if item.summary:
-                line += f": {item.summary[:200]}"
-            summary_parts.append(line)
-
-    all_summaries = "\n".join(summary_parts)
-
-    today = datetime.now().strftime('%Y年%m月%d日')
-
-    system = (
-        "你是咨询公司高级行业顾问，擅长撰写结构清晰、重点突出的政策情报简报。"
-        "你的读者是企业高管和行业分析师，他们需要快速把握政策风向和行业动态。"
-        "你善于从多条信息中归纳趋势，而非简单罗列事实。"
-    )
-
-    prompt = f"""今天是{today}。请根据以下采集条目，撰写一份结构化的政策情报概述（300-600字）。
+# Overview instructions are invariant, so they live in the system message
+# (a stable prefix providers can cache); the user message carries only the
+# date and the items.
+_OVERVIEW_SYSTEM = """你是咨询公司高级行业顾问，擅长撰写结构清晰、重点突出的政策情报简报。你的读者是企业高管和行业分析师，需要快速把握政策风向和行业动态。你善于从多条信息中归纳趋势，而非简单罗列事实。
 
-请按以下步骤思考（不要输出思考过程，只输出最终概述）：
-1. 通读所有条目，识别高频关键词和重复出现的主题
-2. 归纳出2-5个核心主题，多个条目指向同一趋势时合并论述
-3. 为每个主题自由拟定一个精练的section标题
-4. 撰写概述
+任务：根据用户给出的采集条目，撰写结构化的政策情报概述（300-600字）。先通读条目、识别高频主题，归纳2-5个核心主题（指向同一趋势的条目合并论述），只输出最终概述，不输出思考过程。
 
-结构要求：
+结构：
 - 第一个section固定为"## 核心要点"，用1-2句话点明本期最重要的趋势信号和方向判断
-- 后续2-4个section由你根据内容自由拟定标题（不要硬套模板）
-- 如果内容集中在一两个主题，不要硬造section，宁少勿滥
-
-可参考的主题方向（仅供启发，不必照搬）：重大政策信号/行业数据与趋势/监管执行动态/国际合作/人事变动/科技创新/能源安全/市场改革
+- 后续2-4个section自由拟定精练标题（可参考：重大政策信号/行业数据与趋势/监管执行动态/国际合作/人事变动/科技创新/能源安全/市场改革，不必照搬）
+- 内容集中在一两个主题时不要硬造section，宁少勿滥
 
-格式要求：
+格式：
 - 每个部分以 ## 标题开头，标题独占一行，标题后空一行再写正文
-- 正文中用 **粗体** 强调关键信息（如政策名称、数据）
-- 不要使用编号列表（1. 2. 3.），用自然段落叙述
+- 正文用 **粗体** 强调关键信息（如政策名称、数据）
+- 不用编号列表（1. 2. 3.），用自然段落叙述
 - 直接输出，不加"概述""以下是"等前缀
 
-质量要求：
-- 核心要点必须体现"信号价值"——点明趋势或方向，而非复述标题
-- 每个section要有因果分析或影响判断，不要只描述"发生了什么"
-- 用具体数据和事实说话，避免"值得关注""需要注意"等空话
+质量：
+- 核心要点体现"信号价值"——点明趋势或方向，而非复述标题
+- 每个section要有因果分析或影响判断，不只描述"发生了什么"
+- 用具体数据和事实说话，避免"值得关注""需要注意"等空话"""
+
+# Per-item summary snippet length in the overview prompt
+_OVERVIEW_SUMMARY_CHARS = 120
+# Token budget for the item listing in the overview prompt, estimated as
+# len(text) // 2 (mostly Chinese text)
+_OVERVIEW_TOKEN_BUDGET = 6000
+
+# Overview cache: sha256(prompt) -> (monotonic timestamp, overview), so re-runs
+# of the same batch content skip the LLM call
+_OVERVIEW_CACHE_TTL = 3600  # seconds
+_OVERVIEW_CACHE_MAX = 64
+_overview_cache: dict[str, tuple[float, str]] = {}
+
+
+def _overview_item_line(item: Row) -> str:
+    """One '- [type] title (date): summary' line for the overview prompt."""
+    line = f"- [{item.content_type}] {item.title}"
+    if item.published_date:
+        line += f" ({item.published_date})"
+    if item.summary:
+        line += f": {item.summary[:_OVERVIEW_SUMMARY_CHARS]}"
+    return line
+
+
+def _pack_overview_items(
+    by_source: dict[str, list[Row]],
+    token_budget: int = _OVERVIEW_TOKEN_BUDGET,
+) -> str:
+    """Build the overview item listing, packed up to a token budget.
 
-采集条目：
-{all_summaries}"""
+    Items are taken round-robin across sources (each source's items in their
+    existing order) until the next line would exceed the budget, so prolific
+    sources fill leftover space instead of being cut at a fixed count.
+    Output stays grouped by source.
+    """
+    headers = {name: f"【{name}】共{len(items)}条:" for name, items in by_source.items()}
+    used = sum(len(h) // 2 + 1 for h in headers.values())
+    chosen: dict[str, list[str]] = {name: [] for name in by_source}
+
+    active = [(name, iter(items)) for name, items in by_source.items()]
+    full = False
+    while active and not full:
+        still_active = []
+        for name, it in active:
+            item = next(it, None)
+            if item is None:
+                continue
+            line = _overview_item_line(item)
+            cost = len(line) // 2 + 1
+            if used + cost > token_budget:
+                full = True
+                break
+            chosen[name].append(line)
+            used += cost
+            still_active.append((name, it))
+        active = still_active
+
+    parts = []
+    for name, header in headers.items():
+        parts.append(header)
+        parts.extend(chosen[name])
+    return "\n".join(parts)
+
+
+async def _generate_overview(by_source: dict[str, list[Row]]) -> str:
+    """Use LLM to generate a structured overview of all results."""
+    all_summaries = _pack_overview_items(by_source)
+
+    today = datetime.now().strftime('%Y年%m月%d日')
+    prompt = f"今天是{today}。采集条目：\n{all_summaries}\n\n请按要求输出政策情报概述（300-600字）。"
+
+    cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    now = time.monotonic()
+    cached = _overview_cache.get(cache_key)
+    if cached and now - cached[0] < _OVERVIEW_CACHE_TTL:
+        logger.info("Overview cache hit (%s)", cache_key[:12])
+        return cached[1]
 
     try:
-        overview = await simple_completion(prompt, system=system, temperature=0.3, max_tokens=1500)
-        return overview.strip()
+        overview = await simple_completion(prompt, system=_OVERVIEW_SYSTEM, temperature=0.3, max_tokens=1500)
+        overview = overview.strip()
     except Exception as e:
         logger.error("Failed to generate overview: %s", e)
         return ""
 
+    if overview:
+        # Drop expired entries, then the oldest if still full
+        for key in [k for k, (ts, _) in _overview_cache.items() if now - ts >= _OVERVIEW_CACHE_TTL]:
+            del _overview_cache[key]
+        if len(_overview_cache) >= _OVERVIEW_CACHE_MAX:
+            del _overview_cache[next(iter(_overview_cache))]
+        _overview_cache[cache_key] = (now, overview)
+    return overview
+
+
+# Overview Markdown is classified by hand-written scanners rather than regexes:
+# each line is checked by its first few characters, which is all the LLM's
+# small Markdown subset needs. They mirror the previous regex semantics exactly.
+_STRONG_OPEN = "<strong>"
+_STRONG_CLOSE = "</strong>"
+
+
+def _md_bold(text: str) -> str:
+    """Convert **bold** spans (not crossing lines) to <strong>."""
+    i = text.find("**")
+    if i == -1:
+        return text
+    out: list[str] = []
+    pos = 0
+    while i != -1:
+        j = text.find("**", i + 3)  # bold body must be non-empty
+        if j == -1:
+            break
+        if "\n" in text[i + 2:j]:
+            i = text.find("**", i + 1)
+            continue
+        out.append(text[pos:i])
+        out.append(_STRONG_OPEN)
+        out.append(text[i + 2:j])
+        out.append(_STRONG_CLOSE)
+        pos = j + 2
+        i = text.find("**", pos)
+    out.append(text[pos:])
+    return "".join(out)
+
+
+def _md_heading(line: str) -> str | None:
+    """'## title' (1-3 #) -> 'title'."""
+    n = 0
+    while n < len(line) and line[n] == "#":
+        n += 1
+    if 1 <= n <= 3 and n < len(line) and line[n].isspace():
+        return line[n:].lstrip()
+    return None
+
+
+def _md_bullet(line: str) -> str | None:
+    """'- item' / '* item' -> 'item'."""
+    if len(line) > 1 and line[0] in "-*" and line[1].isspace():
+        return line[1:].lstrip()
+    return None
+
+
+def _md_number_end(line: str) -> int:
+    """Index just past a leading 'N.' and any whitespace after it, or -1."""
+    n = 0
+    while n < len(line) and line[n].isdecimal():
+        n += 1
+    if n == 0 or n >= len(line) or line[n] != ".":
+        return -1
+    n += 1
+    while n < len(line) and line[n].isspace():
+        n += 1
+    return n
+
+
+def _md_inline_numbered(line: str) -> tuple[str, str] | None:
+    """'1. <strong>title</strong> body' -> ('title', 'body')."""
+    p = _md_number_end(line)
+    if p == -1 or not line.startswith(_STRONG_OPEN, p):
+        return None
+    start = p + len(_STRONG_OPEN)
+    k = line.find(_STRONG_CLOSE, start + 1)
+    while k != -1:
+        rest = line[k + len(_STRONG_CLOSE):]
+        if rest:
+            return line[start:k], rest.lstrip()
+        k = line.find(_STRONG_CLOSE, k + 1)
+    return None
+
+
+def _md_short_numbered(line: str) -> str | None:
+    """'1. title' or '1. <strong>title</strong>' -> 'title'."""
+    p = _md_number_end(line)
+    if p == -1 or p == len(line):
+        return None
+    tail = line[p:]
+    if tail.startswith(_STRONG_OPEN) and len(tail) > len(_STRONG_OPEN):
+        tail = tail[len(_STRONG_OPEN):]
+    if tail.endswith(_STRONG_CLOSE) and len(tail) > len(_STRONG_CLOSE):
+        tail = tail[:-len(_STRONG_CLOSE)]
+    return tail
+
 
 def _overview_to_html(text: str) -> str:
     """Convert markdown-style overview text to clean, naturally readable HTML.
@@ -1180,7 +1874,7 @@ def _overview_to_html(text: str) -> str:
     text = text.replace("\r\n", "\n").strip()
 
     # Convert **bold** to <strong>
-    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = _md_bold(text)
 
     lines = text.split("\n")
     html_parts: list[str] = []
@@ -1195,6 +1889,22 @@ def _overview_to_html(text: str) -> str:
     li_style = "margin:2px 0;line-height:1.7;color:#374151;"
     ul_style = "margin:6px 0 14px 0;padding-left:20px;color:#374151;"
 
+    # Fast path: no headings, bold, bullets or numbered lines, so the text is
+    # just paragraphs separated by blank lines
+    if "#" not in text and "*" not in text and not any(
+        c == "-" or c.isdecimal() for c in (line.lstrip()[:1] for line in lines)
+    ):
+        for line in lines:
+            stripped = line.strip()
+            if stripped:
+                current_body.append(stripped)
+            elif current_body:
+                html_parts.append(f'<p style="{p_style}">{" ".join(current_body)}</p>')
+                current_body.clear()
+        if current_body:
+            html_parts.append(f'<p style="{p_style}">{" ".join(current_body)}</p>')
+        return "\n".join(html_parts) if html_parts else f'<p style="{p_style}">{text}</p>'
+
     def _flush_body():
         if current_body:
             body = " ".join(current_body).strip()
@@ -1218,41 +1928,39 @@ def _overview_to_html(text: str) -> str:
             continue
 
         # Match ## heading
-        m_hash = re.match(r"^#{1,3}\s+(.+)$", stripped)
-        if m_hash:
+        heading = _md_heading(stripped) if stripped[0] == "#" else None
+        if heading is not None:
             _flush_body()
             _flush_list()
-            html_parts.append(f'<h3 style="{heading_style}">{m_hash.group(1)}</h3>')
+            html_parts.append(f'<h3 style="{heading_style}">{heading}</h3>')
             continue
 
         # Match bullet list: - text or * text
-        m_bullet = re.match(r"^[-*]\s+(.+)$", stripped)
-        if m_bullet:
+        bullet = _md_bullet(stripped)
+        if bullet is not None:
             _flush_body()
-            current_list.append(m_bullet.group(1))
+            current_list.append(bullet)
             continue
 
         # If we were building a list and hit non-list content, flush it
         _flush_list()
 
-        # Match inline numbered heading + body: "1. <strong>核心要点</strong> some content"
-        m_inline = re.match(
-            r"^(\d+)\.\s*<strong>(.+?)</strong>\s*(.+)$", stripped
-        )
-        if m_inline:
-            _flush_body()
-            html_parts.append(f'<h3 style="{heading_style}">{m_inline.group(2)}</h3>')
-            current_body.append(m_inline.group(3))
-            continue
+        if stripped[0].isdecimal():
+            # Match inline numbered heading + body: "1. <strong>核心要点</strong> some content"
+            inline = _md_inline_numbered(stripped)
+            if inline is not None:
+                _flush_body()
+                html_parts.append(f'<h3 style="{heading_style}">{inline[0]}</h3>')
+                current_body.append(inline[1])
+                continue
 
-        # Match short numbered heading: "1. 核心要点" or "1. <strong>核心要点</strong>"
-        m_num = re.match(
-            r"^(\d+)\.\s*(?:<strong>)?(.+?)(?:</strong>)?\s*$", stripped
-        )
-        if m_num and len(stripped) < 40:
-            _flush_body()
-            html_parts.append(f'<h3 style="{heading_style}">{m_num.group(2)}</h3>')
-            continue
+            # Match short numbered heading: "1. 核心要点" or "1. <strong>核心要点</strong>"
+            if len(stripped) < 40:
+                short = _md_short_numbered(stripped)
+                if short is not None:
+                    _flush_body()
+                    html_parts.append(f'<h3 style="{heading_style}">{short}</h3>')
+                    continue
 
         # Regular body text
         current_body.append(stripped)
@@ -1267,83 +1975,53 @@ def _overview_to_html(text: str) -> str:
     return "\n".join(html_parts)
 
 
-async def _generate_report(batch_id: str, user_id: int = 1):
-    """Generate a report from the batch results and dispatch notifications."""
-    async with async_session() as session:
-        # Fetch all results for this batch
-        tasks_q = await session.execute(
-            select(CrawlTask).where(CrawlTask.batch_id == batch_id)
-        )
-        tasks = list(tasks_q.scalars().all())
-
-        results_q = await session.execute(
-            select(CrawlResult).where(
-                CrawlResult.task_id.in_([t.id for t in tasks])
-            ).order_by(CrawlResult.source_id, CrawlResult.published_date.desc())
-        )
-        results = list(results_q.scalars().all())
-
-    if not results:
-        logger.info("Batch %s: no results to report", batch_id)
-        return
-
-    # Group by source
-    by_source: dict[str, list[CrawlResult]] = defaultdict(list)
-    for r in results:
-        # Find source name from tasks
-        src_name = next((t.source_name for t in tasks if t.source_id == r.source_id), f"源{r.source_id}")
-        by_source[src_name].append(r)
-
-    # Generate aggregated overview via LLM
-    overview = await _generate_overview(by_source)
-
-    # Build title: {源名称}更新汇总报告YYYY-MM-DD
-    now = datetime.now()
-    source_names = "、".join(by_source.keys())
-    title = f"{source_names}更新汇总报告{now.strftime('%Y-%m-%d')}"
+# Report HTML fragments; per-item ones are filled with str.format
+_REPORT_OVERVIEW_OPEN = (
+    '<div style="margin:20px 0;padding:20px;background:#f0f7ff;border-radius:8px;border-left:4px solid #1a56db;">\n'
+    '<h2 style="margin:0 0 12px 0;color:#1a56db;font-size:18px;">整体概述</h2>'
+)
+_REPORT_OVERVIEW_CLOSE = '</div>\n<hr style="margin:24px 0;border-color:#e5e7eb;">'
+_REPORT_SOURCE_HEADING = '<h2 style="border-left:4px solid #1a56db;padding-left:12px;">{name} · {count} 条更新</h2>'
+_REPORT_ITEM_OPEN = '<div style="margin:16px 0;padding:12px;border:1px solid #e5e7eb;border-radius:8px;">'
+_REPORT_ITEM_TITLE = '<p style="margin:0;"><strong>[{label}] {title}</strong></p>'
+_REPORT_ITEM_DATE = '<p style="color:#6b7280;font-size:14px;">发布日期：{date}</p>'
+_REPORT_ITEM_SUMMARY = '<p style="margin:8px 0;">{summary}</p>'
+_REPORT_ITEM_ATTACHMENT = '<p>📎 附件: {name}</p>'
+_REPORT_ITEM_ATTACHMENT_SUMMARY = '<p style="color:#4b5563;font-size:14px;">附件摘要: {summary}</p>'
+_REPORT_ITEM_LINK = '<p><a href="{url}" style="color:#1a56db;">📖 查看原文</a></p>\n</div>'
+_REPORT_FOOTER = (
+    '<hr style="margin:24px 0;">\n'
+    '<p style="color:#9ca3af;font-size:12px;">此邮件由政策情报助手自动生成（AI摘要仅供参考）</p>'
+)
 
-    # Build HTML
-    html_parts = [f"<h1>{title}</h1>"]
 
-    # Overview section
-    if overview:
-        overview_html = _overview_to_html(overview)
-        html_parts.append('<div style="margin:20px 0;padding:20px;background:#f0f7ff;border-radius:8px;border-left:4px solid #1a56db;">')
-        html_parts.append('<h2 style="margin:0 0 12px 0;color:#1a56db;font-size:18px;">整体概述</h2>')
-        html_parts.append(overview_html)
-        html_parts.append('</div>')
-        html_parts.append('<hr style="margin:24px 0;border-color:#e5e7eb;">')
-
-    # Build plain text
-    text_parts = [title, "=" * 40]
-
-    if overview:
-        text_parts.append("\n【整体概述】")
-        text_parts.append(overview)
-        text_parts.append("\n" + "-" * 40)
+def _build_source_sections(by_source: dict[str, list[Row]]) -> tuple[str, str]:
+    """Render the per-source item listings of a report as (html, text)."""
+    html_parts: list[str] = []
+    text_parts: list[str] = []
 
-    # Per-source sections
     for src_name, items in by_source.items():
-        html_parts.append(f'<h2 style="border-left:4px solid #1a56db;padding-left:12px;">{src_name} · {len(items)} 条更新</h2>')
+        html_parts.append(_REPORT_SOURCE_HEADING.format(name=html.escape(src_name), count=len(items)))
         text_parts.append(f"\n== {src_name} ({len(items)}条更新) ==\n")
 
         for i, item in enumerate(items, 1):
-            # HTML
-            type_label = {"news": "新闻", "policy": "政策", "notice": "通知", "file": "文件"}.get(item.content_type, "内容")
-            html_parts.append(f'<div style="margin:16px 0;padding:12px;border:1px solid #e5e7eb;border-radius:8px;">')
-            html_parts.append(f'<p style="margin:0;"><strong>[{type_label}] {item.title}</strong></p>')
+            # HTML: crawled fields are escaped once here; text output uses them raw
+            type_label = _CONTENT_TYPE_LABELS.get(item.content_type, "内容")
+            html_parts.append(_REPORT_ITEM_OPEN)
+            html_parts.append(_REPORT_ITEM_TITLE.format(label=type_label, title=html.escape(item.title)))
             if item.published_date:
-                html_parts.append(f'<p style="color:#6b7280;font-size:14px;">发布日期：{item.published_date}</p>')
+                html_parts.append(_REPORT_ITEM_DATE.format(date=item.published_date))
             # Only show summary if it's meaningful (not empty, not same as title)
             has_real_summary = item.summary and item.summary.strip() != item.title.strip()
             if has_real_summary:
-                html_parts.append(f'<p style="margin:8px 0;">{item.summary}</p>')
+                html_parts.append(_REPORT_ITEM_SUMMARY.format(summary=html.escape(item.summary)))
             if item.has_attachment and item.attachment_name:
-                html_parts.append(f'<p>📎 附件: {item.attachment_name}</p>')
+                html_parts.append(_REPORT_ITEM_ATTACHMENT.format(name=html.escape(item.attachment_name)))
                 if item.attachment_summary:
-                    html_parts.append(f'<p style="color:#4b5563;font-size:14px;">附件摘要: {item.attachment_summary}</p>')
-            html_parts.append(f'<p><a href="{item.url}" style="color:#1a56db;">📖 查看原文</a></p>')
-            html_parts.append('</div>')
+                    html_parts.append(_REPORT_ITEM_ATTACHMENT_SUMMARY.format(
+                        summary=html.escape(item.attachment_summary),
+                    ))
+            html_parts.append(_REPORT_ITEM_LINK.format(url=html.escape(item.url, quote=True)))
 
             # Plain text
             text_parts.append(f"{i}. [{type_label}] {item.title}")
@@ -1356,27 +2034,109 @@ async def _generate_report(batch_id: str, user_id: int = 1):
             text_parts.append(f"   链接: {item.url}")
             text_parts.append("")
 
-    html_parts.append('<hr style="margin:24px 0;">')
-    html_parts.append('<p style="color:#9ca3af;font-size:12px;">此邮件由政策情报助手自动生成（AI摘要仅供参考）</p>')
+    return "\n".join(html_parts), "\n".join(text_parts)
+
+
+def _build_report_bodies(title: str, overview: str, sections_html: str, sections_text: str) -> tuple[str, str]:
+    """Assemble the full report (html, text) around the rendered listings."""
+    # Build HTML (title is built from source names, so escape it like them)
+    html_parts = [f"<h1>{html.escape(title)}</h1>"]
+
+    # Overview section
+    if overview:
+        overview_html = _overview_to_html(overview)
+        html_parts.append(_REPORT_OVERVIEW_OPEN)
+        html_parts.append(overview_html)
+        html_parts.append(_REPORT_OVERVIEW_CLOSE)
+
+    html_parts.append(sections_html)
+    html_parts.append(_REPORT_FOOTER)
 
-    content_html = "\n".join(html_parts)
-    content_text = "\n".join(text_parts)
+    # Build plain text
+    text_parts = [title, "=" * 40]
+
+    if overview:
+        text_parts.append("\n【整体概述】")
+        text_parts.append(overview)
+        text_parts.append("\n" + "-" * 40)
+
+    text_parts.append(sections_text)
+
+    return "\n".join(html_parts), "\n".join(text_parts)
+
+
+# CrawlResult columns read when building a report; selected as plain rows
+# instead of hydrating full ORM instances
+_REPORT_COLUMNS = (
+    CrawlResult.source_id,
+    CrawlResult.content_type,
+    CrawlResult.title,
+    CrawlResult.url,
+    CrawlResult.summary,
+    CrawlResult.published_date,
+    CrawlResult.has_attachment,
+    CrawlResult.attachment_name,
+    CrawlResult.attachment_summary,
+)
+
+
+async def _generate_report(batch_id: str, user_id: int = 1):
+    """Generate a report from the batch results and dispatch notifications."""
+    # Fetch all results for this batch with their source names (one joined query)
+    async with async_session() as session:
+        rows_q = await session.execute(
+            select(*_REPORT_COLUMNS, CrawlTask.source_name)
+            .join(CrawlTask, CrawlResult.task_id == CrawlTask.id)
+            .where(CrawlTask.batch_id == batch_id)
+            .order_by(CrawlResult.source_id, CrawlResult.published_date.desc())
+        )
+        rows = rows_q.all()
+
+    if not rows:
+        logger.info("Batch %s: no results to report", batch_id)
+        return
+
+    # Group by source: rows arrive ordered by source_id, so groups are contiguous
+    by_source: dict[str, list[Row]] = {}
+    for source_id, group in groupby(rows, key=lambda row: row.source_id):
+        group = list(group)
+        src_name = group[0].source_name or f"源{source_id}"
+        by_source.setdefault(src_name, []).extend(group)
+
+    # Generate aggregated overview via LLM; the per-source listings are
+    # rendered in a worker thread meanwhile
+    overview, (sections_html, sections_text) = await asyncio.gather(
+        _generate_overview(by_source),
+        asyncio.to_thread(_build_source_sections, by_source),
+    )
+
+    # Build title: {源名称}更新汇总报告YYYY-MM-DD
+    source_names = "、".join(by_source)
+    title = f"{source_names}更新汇总报告{datetime.now():%Y-%m-%d}"
+
+    # Render the overview and splice the report together off the event loop
+    content_html, content_text = await asyncio.to_thread(
+        _build_report_bodies, title, overview, sections_html, sections_text,
+    )
 
     # Save report
     async with async_session() as session:
-        report = Report(
-            batch_id=batch_id,
-            title=title,
-            content_html=content_html,
-            content_text=content_text,
-            overview=overview,
-            user_id=user_id,
+        inserted = await session.execute(
+            insert(Report)
+            .values(
+                batch_id=batch_id,
+                title=title,
+                content_html=content_html,
+                content_text=content_text,
+                overview=overview,
+                user_id=user_id,
+            )
+            .returning(Report.id)
         )
-        session.add(report)
+        report_id = inserted.scalar_one()
         await session.commit()
-        report_id = report.id
 
     logger.info("Report generated: %s (id=%d)", title, report_id)
 
     # Dispatch notifications
-    await dispatch_report(batch_id, title, content_html, content_text, results)
+    await dispatch_report(batch_id, title, content_html, content_text, rows)
@@ -1,6 +1,7 @@
 """System prompts for the crawl agent."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from string import Template
 
 
@@ -112,6 +113,12 @@ PREVIEW_SAMPLE_VALUES = {
 }
 
 
+@lru_cache(maxsize=32)
+def _compiled_template(template_str: str) -> Template:
+    """Template for a prompt string, reused across agent runs with the same template."""
+    return Template(template_str)
+
+
 def build_system_prompt(
     source_name: str,
     source_url: str,
@@ -155,59 +162,19 @@ def build_system_prompt(
     }
 
     template_str = custom_template or DEFAULT_TEMPLATE
-    return Template(template_str).safe_substitute(context)
+    return _compiled_template(template_str).safe_substitute(context)
 
 
-def build_section_prompt(
-    section_name: str,
-    section_url: str,
-    date_range: str,
-    max_items: int = 30,
-    existing_urls: list[str] | None = None,
-    crawl_rules: str = "",
-) -> str:
-    """Build a focused system prompt for a Phase 1b section crawler sub-agent.
-
-    Each section crawler gets a clean, concise prompt (~400 chars + URL list)
-    with URL date examples as few-shot guidance.
-    """
-    existing_urls_section = ""
-    if existing_urls:
-        urls_text = "\n".join(f"- {u}" for u in existing_urls[:100])
-        existing_urls_section = (
-            "\n## 已采集URL（请跳过）\n"
-            "以下URL已在之前的采集中收录，请不要重复采集：\n"
-            f"{urls_text}\n"
-        )
-
-    # Extract content priority section from crawl_rules if available
-    priority_section = ""
-    if crawl_rules:
-        # Look for the priority section in custom rules
-        marker = "### 内容优先级"
-        if marker in crawl_rules:
-            priority_section = "\n## 内容筛选优先级（请严格遵守）\n" + crawl_rules[crawl_rules.index(marker):]
-        else:
-            priority_section = "\n## 采集规则（请严格遵守）\n" + crawl_rules
-
-    if not priority_section:
-        priority_section = """
-## 内容筛选优先级
-当条目数量超过上限时，优先保留以下内容：
-1. 国家层面重大政策（法律法规、国务院文件、部委规划、指导意见）
-2. 高级领导人讲话、重要批示、人事任免
-3. 全国性新闻、全国性会议
-4. 行业统计数据、发展报告
-5. 地方性通知、执行层面文件（优先级较低）
-6. 地方监管局日常工作动态、来访接待（优先级最低，可不采集）"""
-
-    return f"""你是政策信息采集助手。请采集以下栏目列表页中，日期范围内的内容条目。
+# Phase 1b section crawler prompt (string.Template). Only the per-section
+# fields change between sections; the crawl_rules-derived priority block is
+# cached per crawl_rules by _section_priority().
+_SECTION_TEMPLATE = Template(r"""你是政策信息采集助手。请采集以下栏目列表页中，日期范围内的内容条目。
 
 ## 任务
-- **栏目**: {section_name}
-- **列表页URL**: {section_url}
-- **采集日期范围**: {date_range}
-- **最大采集条数**: {max_items} 条
+- **栏目**: $section_name
+- **列表页URL**: $section_url
+- **采集日期范围**: $date_range
+- **最大采集条数**: $max_items 条
 
 ## 工作流程
 1. 用 browse_page 打开列表页
@@ -217,7 +184,7 @@ def build_section_prompt(
    - summary 字段留空
 3. 如有"下一页"链接且未达到采集上限，翻页继续
 4. 采集完成后调用 finish
-{priority_section}
+$priority_section
 
 ## content_type 分类
 - policy: 法规、规划、指导意见、管理办法等正式文件
@@ -258,4 +225,58 @@ def build_section_prompt(
 | /2026-01/15/xxx.htm | 2026-01-15 |
 | /art/2026/2/3/xxx.html | 2026-02-03 |
 | /202601/t20260115_xxx.html | 2026-01-15 |
-{existing_urls_section}"""
+$existing_urls_section""")
+
+_DEFAULT_SECTION_PRIORITY = """
+## 内容筛选优先级
+当条目数量超过上限时，优先保留以下内容：
+1. 国家层面重大政策（法律法规、国务院文件、部委规划、指导意见）
+2. 高级领导人讲话、重要批示、人事任免
+3. 全国性新闻、全国性会议
+4. 行业统计数据、发展报告
+5. 地方性通知、执行层面文件（优先级较低）
+6. 地方监管局日常工作动态、来访接待（优先级最低，可不采集）"""
+
+
+@lru_cache(maxsize=64)
+def _section_priority(crawl_rules: str) -> str:
+    """Extract the content priority section from crawl_rules if available."""
+    if not crawl_rules:
+        return _DEFAULT_SECTION_PRIORITY
+    # Look for the priority section in custom rules
+    marker = "### 内容优先级"
+    if marker in crawl_rules:
+        return "\n## 内容筛选优先级（请严格遵守）\n" + crawl_rules[crawl_rules.index(marker):]
+    return "\n## 采集规则（请严格遵守）\n" + crawl_rules
+
+
+def build_section_prompt(
+    section_name: str,
+    section_url: str,
+    date_range: str,
+    max_items: int = 30,
+    existing_urls: list[str] | None = None,
+    crawl_rules: str = "",
+) -> str:
+    """Build a focused system prompt for a Phase 1b section crawler sub-agent.
+
+    Each section crawler gets a clean, concise prompt (~400 chars + URL list)
+    with URL date examples as few-shot guidance.
+    """
+    existing_urls_section = ""
+    if existing_urls:
+        urls_text = "\n".join(f"- {u}" for u in existing_urls[:100])
+        existing_urls_section = (
+            "\n## 已采集URL（请跳过）\n"
+            "以下URL已在之前的采集中收录，请不要重复采集：\n"
+            f"{urls_text}\n"
+        )
+
+    return _SECTION_TEMPLATE.substitute(
+        section_name=section_name,
+        section_url=section_url,
+        date_range=date_range,
+        max_items=max_items,
+        priority_section=_section_priority(crawl_rules),
+        existing_urls_section=existing_urls_section,
+    )
@@ -9,6 +9,7 @@ from typing import Callable, Awaitable
 from app.llm.client import chat_completion
 from app.llm.schemas import ALL_TOOLS
 from app.agent.prompts import build_system_prompt
+from app.agent.domain_filter import DomainFilter
 from app.agent.tools.browser import browse_page, close_browser
 from app.agent.tools.downloader import download_file
 from app.agent.tools.document import read_document
@@ -45,6 +46,7 @@ class AgentResult:
         self.source_id = source_id
         self.source_name = source_name
         self.source_url = source_url
+        self.domain_filter = DomainFilter(source_url)
         self.items: list[dict] = []
         self.finish_summary: str = ""
         self.error: str = ""
@@ -252,10 +254,8 @@ async def _execute_tool(name: str, args: dict, result: AgentResult) -> str:
                 "attachment_summary": args.get("attachment_summary", ""),
             }
             # Domain check: skip cross-domain items
-            if result.source_url and item["url"]:
-                from app.agent.domain_filter import is_same_domain
-                if not is_same_domain(item["url"], result.source_url):
-                    return f"已跳过（跨域内容）: {item['title']}"
+            if not result.domain_filter.is_same_domain(item["url"]):
+                return f"已跳过（跨域内容）: {item['title']}"
             result.items.append(item)
             return f"已保存: {item['title']}（共{len(result.items)}条）"
 
@@ -280,11 +280,9 @@ async def _execute_tool(name: str, args: dict, result: AgentResult) -> str:
                     continue
                 item_url = item.get("url", "")
                 # Domain check: skip cross-domain items
-                if result.source_url and item_url:
-                    from app.agent.domain_filter import is_same_domain
-                    if not is_same_domain(item_url, result.source_url):
-                        skipped_count += 1
-                        continue
+                if not result.domain_filter.is_same_domain(item_url):
+                    skipped_count += 1
+                    continue
                 title = _clean_title(item.get("title", ""))
                 summary = item.get("summary", "")
                 # Discard summary if it's just a copy of the title
@@ -3,45 +3,109 @@ import asyncio
 import logging
 import re
 
-from playwright.async_api import async_playwright, Browser, BrowserContext
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
-from app.config import AGENT_PAGE_DELAY
+from app.config import AGENT_PAGE_DELAY, BROWSER_MAX_TABS
 
 logger = logging.getLogger(__name__)
 
+_playwright: Playwright | None = None
 _browser: Browser | None = None
 _context: BrowserContext | None = None
+_launch_lock = asyncio.Lock()
+
+# Tab pool: idle pages are reused across browse_page calls; the semaphore
+# caps how many pages are open at once.
+_idle_pages: list[Page] = []
+_tab_sem = asyncio.Semaphore(BROWSER_MAX_TABS)
 
 
 async def _ensure_browser() -> BrowserContext:
     """Launch or reuse a shared browser instance."""
-    global _browser, _context
-    if _browser is None or not _browser.is_connected():
-        pw = await async_playwright().start()
-        _browser = await pw.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-dev-shm-usage"],
-        )
-        _context = await _browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/125.0.0.0 Safari/537.36"
-            ),
-            locale="zh-CN",
-        )
+    global _playwright, _browser, _context
+    async with _launch_lock:
+        if _browser is None or not _browser.is_connected():
+            _idle_pages.clear()
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(
+                headless=True,
+                args=["--no-sandbox", "--disable-dev-shm-usage"],
+            )
+            _context = await _browser.new_context(
+                user_agent=(
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/125.0.0.0 Safari/537.36"
+                ),
+                locale="zh-CN",
+            )
     return _context
 
 
+async def ensure_browser():
+    """Start the shared browser ahead of time so the first page load doesn't pay for it."""
+    await _ensure_browser()
+
+
+async def _acquire_page() -> Page:
+    """Take an idle page from the pool, or open a new one."""
+    context = await _ensure_browser()
+    while _idle_pages:
+        page = _idle_pages.pop()
+        if not page.is_closed():
+            return page
+    return await context.new_page()
+
+
+async def _release_page(page: Page, reusable: bool):
+    """Return a page to the pool, or close it if it is not safe to reuse.
+
+    Pooled pages are parked on about:blank first so the previous document's
+    timers, requests and media stop before the next goto.
+    """
+    if reusable and not page.is_closed() and _browser is not None and _browser.is_connected():
+        try:
+            await page.goto("about:blank")
+        except Exception:
+            pass
+        else:
+            _idle_pages.append(page)
+            return
+    try:
+        await page.close()
+    except Exception:
+        pass
+
+
 async def close_browser():
-    """Close the shared browser instance."""
-    global _browser, _context
-    if _context:
-        await _context.close()
-        _context = None
-    if _browser:
-        await _browser.close()
-        _browser = None
+    """Close the shared browser instance.
+
+    Takes every tab slot first, so browse_page calls already in flight finish
+    before their page is closed underneath them. Then holds the launch lock
+    so a concurrent _ensure_browser waits for the teardown to finish and
+    relaunches, instead of handing out a context that is being closed.
+    """
+    global _playwright, _browser, _context
+    acquired = 0
+    try:
+        for _ in range(BROWSER_MAX_TABS):
+            await _tab_sem.acquire()
+            acquired += 1
+        async with _launch_lock:
+            _idle_pages.clear()
+            if _context:
+                await _context.close()
+                _context = None
+            if _browser:
+                await _browser.close()
+                _browser = None
+            if _playwright:
+                await _playwright.stop()
+                _playwright = None
+    finally:
+        for _ in range(acquired):
+            _tab_sem.release()
 
 
 def _clean_text(text: str) -> str:
@@ -59,8 +123,13 @@ async def browse_page(url: str) -> str:
     - Extracts dates associated with each link from parent elements
     - Includes a polite delay between requests
     """
-    context = await _ensure_browser()
-    page = await context.new_page()
+    await _tab_sem.acquire()
+    try:
+        page = await _acquire_page()
+    except Exception:
+        _tab_sem.release()
+        raise
+    reusable = False
     try:
         await page.goto(url, wait_until="domcontentloaded", timeout=30000)
         # Wait a short while for dynamic content
@@ -174,11 +243,14 @@ async def browse_page(url: str) -> str:
             # Page has links but none with extractable dates — signal to agent
             text += "\n\n注意：此页面未检测到带日期的条目。如果连续多页无日期条目，建议调用 finish 结束当前栏目。\n"
 
+        reusable = True
         return text
     except Exception as e:
         logger.error("Failed to browse %s: %s", url, e)
         return f"页面加载失败: {e}"
     finally:
-        await page.close()
+        # Pages that errored (timeouts, crashed renderers) are closed, not pooled
+        await _release_page(page, reusable)
+        _tab_sem.release()
         # Polite delay
         await asyncio.sleep(AGENT_PAGE_DELAY)
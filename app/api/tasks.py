@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.connection import get_db
 from app.models.task import CrawlTask, TaskStatus
 from app.models.result import CrawlResult
+from app.models.section_cache import SectionCache
 from app.models.user import User
 from app.auth import get_current_user, get_effective_user_id
 from app.agent.orchestrator import run_batch, is_running, get_running_sources, request_cancel, release_source, _section_history
@@ -146,11 +147,16 @@ async def cancel_task(task_id: int, db: AsyncSession = Depends(get_db), user: Us
 
 
 @router.post("/clear-section-history")
-async def clear_section_history(user: User = Depends(get_current_user)):
-    """Clear section history for all sources (useful for testing)."""
+async def clear_section_history(db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)):
+    """Clear section history and cached sections for all sources (useful for testing).
+
+    Dropping the cached sections forces the next run to re-identify them.
+    """
     count = len(_section_history)
     _section_history.clear()
-    return {"ok": True, "cleared_sources": count}
+    result = await db.execute(sa_delete(SectionCache))
+    await db.commit()
+    return {"ok": True, "cleared_sources": count, "cleared_cached_sections": result.rowcount}
 
 
 @router.delete("/clear-finished")
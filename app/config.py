@@ -39,6 +39,9 @@ DEFAULT_SENDER_NAME = os.getenv("SENDER_NAME", "政策情报助手")
 AGENT_MAX_TURNS = 50  # Maximum LLM call rounds per agent
 AGENT_PAGE_DELAY = 2.0  # Seconds between page visits (anti-crawl)
 AGENT_MAX_FILE_SIZE_MB = 50  # Max downloadable file size
+HOMEPAGE_FILTER_MIN_TOKENS = 400  # Skip the LLM homepage filter below this prompt size (0 = always call)
+BROWSE_MAX_CONCURRENCY = 3  # Max concurrent page fetches during Phase 2 summaries
+BROWSER_MAX_TABS = 8  # Max open pages in the shared browser (idle pages are reused)
 
 # LLM settings
 LLM_MAX_RETRIES = 3  # Max retry attempts for transient LLM errors
@@ -46,3 +49,4 @@ LLM_MAX_CONCURRENCY = 3  # Max concurrent LLM API requests
 
 # Source-level concurrency
 AGENT_MAX_CONCURRENCY = 5  # Max concurrent source agents running in parallel
+SECTION_MAX_CONCURRENCY = 3  # Max concurrent section sub-agents per source (Phase 1b)
@@ -1,14 +1,37 @@
 import logging
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from app.config import DATABASE_URL
+from app.config import DATABASE_URL, AGENT_MAX_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+# Keep SQLite connections open between sessions (aiosqlite otherwise defaults
+# to NullPool, which opens a new connection and worker thread every time).
+# Sized for one connection per concurrent source plus API requests; no
+# pre-ping, since a local SQLite file connection doesn't go stale.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=AGENT_MAX_CONCURRENCY + 5,
+    max_overflow=5,
+    pool_pre_ping=False,
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """WAL lets API reads proceed while a source run is writing its results."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -16,6 +16,11 @@ logger = logging.getLogger(__name__)
 # Concurrency limiter for LLM API calls
 _llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
 
+# AsyncOpenAI clients keyed by (base_url, api_key). Each client owns an httpx
+# connection pool, so reusing it keeps connections (and TLS sessions) alive
+# across calls instead of handshaking for every completion.
+_clients: dict[tuple[str, str], AsyncOpenAI] = {}
+
 # Transient error types that should be retried
 _RETRYABLE_ERRORS = (
     openai.APITimeoutError,
@@ -35,7 +40,7 @@ async def get_active_llm_config() -> LLMConfig | None:
 
 
 def build_client(config: LLMConfig) -> AsyncOpenAI:
-    """Build an AsyncOpenAI client from a config record."""
+    """Return the AsyncOpenAI client for a config record, creating it on first use."""
     # Strip /chat/completions suffix if present — the SDK appends it automatically
     base_url = config.api_url
     for suffix in ["/chat/completions", "/chat"]:
@@ -43,7 +48,19 @@ def build_client(config: LLMConfig) -> AsyncOpenAI:
             base_url = base_url[: -len(suffix)]
             break
 
-    return AsyncOpenAI(api_key=config.api_key, base_url=base_url)
+    key = (base_url, config.api_key)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = AsyncOpenAI(api_key=config.api_key, base_url=base_url)
+    return client
+
+
+async def close_clients():
+    """Close all cached LLM clients (called on application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
 
 
 async def chat_completion(
@@ -12,7 +12,7 @@ from app.database.migrations import seed_default_data
 from app.scheduler.scheduler import init_scheduler
 
 # Import all models so SQLAlchemy knows about them
-from app.models import source, task, result, report, push_rule, settings, user  # noqa: F401
+from app.models import source, task, result, report, push_rule, settings, user, section_cache, summary_cache  # noqa: F401
 
 logging.basicConfig(
     level=logging.INFO,
@@ -45,7 +45,9 @@ async def lifespan(app: FastAPI):
     await init_scheduler()
     logging.getLogger(__name__).info("Application started")
     yield
-    # Shutdown (cleanup if needed)
+    # Shutdown
+    from app.llm.client import close_clients
+    await close_clients()
 
 
 app = FastAPI(title="政策情报助手", version="1.0.0", lifespan=lifespan)
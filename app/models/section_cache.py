@@ -0,0 +1,15 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.connection import Base
+
+
+class SectionCache(Base):
+    """Last identified homepage sections per source, keyed by a nav fingerprint."""
+    __tablename__ = "section_cache"
+
+    source_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    link_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # sha256 of date-stripped nav links
+    sections: Mapped[list] = mapped_column(JSON, default=list)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
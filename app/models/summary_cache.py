@@ -0,0 +1,17 @@
+from datetime import datetime
+from sqlalchemy import String, Text, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.connection import Base
+
+
+class SummaryCache(Base):
+    """Generated article summaries, reused when the same URL is summarized again with unchanged content."""
+    __tablename__ = "summary_cache"
+
+    url_hash: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256 of canonical URL
+    content_hash: Mapped[str] = mapped_column(String(64), default="")  # sha256 of the summarized article text
+    summary: Mapped[str] = mapped_column(Text, nullable=False)
+    tags: Mapped[str] = mapped_column(String(500), default="")
+    content_type: Mapped[str] = mapped_column(String(20), default="")
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
@@ -1,11 +1,10 @@
 """Push notification engine: dispatches reports according to push rules."""
 import logging
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 
 from app.database.connection import async_session
 from app.models.push_rule import PushRule
-from app.models.result import CrawlResult
 from app.notification.email_sender import send_email
 
 logger = logging.getLogger(__name__)
@@ -16,9 +15,12 @@ async def dispatch_report(
     title: str,
     content_html: str,
     content_text: str,
-    results: list[CrawlResult],
+    results: list[Row],
 ):
-    """Dispatch the report to all matching push rules."""
+    """Dispatch the report to all matching push rules.
+
+    results are the report's crawl_results rows; only source_id is read.
+    """
     async with async_session() as session:
         q = await session.execute(
             select(PushRule).where(PushRule.is_active == True)